@@ -1,38 +1,49 @@
 import logging
 import os.path
 import typing as t
-from dataclasses import fields
+from collections import Counter
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import settings
-from BaseClasses import Item, Location, Region, ItemClassification, CollectionState, Tutorial, MultiWorld
-from Options import PerGameCommonOptions
+from BaseClasses import (
+    Item,
+    Location,
+    LocationProgressType,
+    Region,
+    ItemClassification,
+    CollectionState,
+    Tutorial,
+    MultiWorld,
+)
 from Utils import output_path
 from worlds.AutoWorld import WebWorld, World
 from worlds.Files import APDeltaPatch
 
 from .gen import (
-    ItemId,
-    LocationId,
-    character_class_keys,
-    character_exists_keys,
-    character_in_logic_keys,
-    character_items,
-    character_starter_weapon_keys,
+    element_names,
+    item_classifications,
     progression_event_rewards,
-    progression_items,
     spell_progression,
-    useful_items,
     item_name_to_id,
+    item_names_by_id,
     location_name_to_id,
+    location_names_by_id,
     item_name_groups,
 )
-from .options import SoMOptions, Goal, SoMROptionProto
+from .logic import LogicTable, export_requirements, get_seed_count, normalize_requirements, update_fingerprint
+from .logic_data import LogicData, build_logic_data, get_cache_key, load_cached, store_cached
+from .scheduler import MemoryBudget, estimate_ow_memory, get_memory_budget
+from .options import SoMOptions, Goal, get_somr_settings
+from .spoiler import copy_spoiler
 
 if t.TYPE_CHECKING:
     from pysomr import OW
 
+    from .gen import ItemId, LocationId
+
 required_pysomr_version = "1.48.0a3"  # TODO: grab from requirements.txt
 
 
@@ -100,7 +111,47 @@ class SoMSettings(settings.Group):
                     return data[0x200:]
                 return data
 
+    class SpoilerSections(str):
+        """
+        Sections of the SoMR spoiler to append to the AP spoiler, separated by comma. Empty appends the whole spoiler,
+        "none" appends nothing. A section is a block of lines separated by empty lines and is matched by its first line.
+        """
+
+    class LogicCache(settings.Bool):
+        """
+        Cache what SoMR decided for a seed on disk, so regenerating the same seed with the same options can skip
+        building SoMR until output.
+        """
+
+    class OWBuildMode(str):
+        """
+        How to build SoMR for multiple SoM slots in generate_early: "serial", "threads" or "processes".
+        "threads" assumes that building SoMR is thread-safe, which is not verified, and only scales if it releases the
+        GIL or on a free-threaded Python. "processes" is always safe, but has to rebuild SoMR for output.
+        """
+
+    class OWBuildWorkers(int):
+        """Max number of SoMR instances to build in parallel. 0 uses the number of CPUs."""
+
+    class OWBuildRetries(int):
+        """
+        How often to retry building SoMR with a new SoMR seed in generate_early after a transient error, i.e. running
+        out of memory or a crashed worker process. Other errors, e.g. SoMR rejecting the options, are not retried.
+        """
+
+    class SoMRMemoryBudget(int):
+        """
+        Max estimated memory in MiB of SoMR instances that exist at the same time, when building in parallel and for
+        output. More SoMR work is queued. 0 uses half of the physical memory.
+        """
+
     rom_file: RomFile = RomFile(RomFile.copy_to)
+    logic_cache: LogicCache | bool = False
+    ow_build_mode: OWBuildMode = OWBuildMode("serial")
+    ow_build_workers: OWBuildWorkers = OWBuildWorkers(0)
+    ow_build_retries: OWBuildRetries = OWBuildRetries(0)
+    somr_memory_budget: SoMRMemoryBudget = SoMRMemoryBudget(0)
+    somr_spoiler_sections: SpoilerSections = SpoilerSections("")
 
 
 class SoMWorld(World):
@@ -120,17 +171,37 @@ class SoMWorld(World):
     location_name_to_id = location_name_to_id
     item_name_groups = item_name_groups
 
-    ow: "OW"
-    """upstream SoMR OpenWorld instance"""
+    ow: "OW | None" = None
+    """upstream SoMR OpenWorld instance, only alive while extracting logic data and during generate_output"""
+    somr_settings: dict[str, str]
+    """SoMR settings, excluding output-only settings"""
+    logic_data: LogicData
+    """what SoMR decided, see logic_data.py"""
+    logic_data_pending: bool = False
+    """logic_data still has to be built in stage_generate_early"""
+    logic_cache_key: str | None = None
+    retried_errors: t.ClassVar[tuple[type[Exception], ...]] = (MemoryError, BrokenExecutor)
+    """transient errors of building SoMR that are retried, see should_retry"""
     somr_log_dir: TemporaryDirectory[str] | None = None
     somr_log_file: t.TextIO | None = None
-    somr_spoiler_file: t.TextIO | None = None
+    somr_log_forwarded: int = 0
+    """number of characters of the SoMR log forwarded as debug message"""
+    somr_log_truncated: bool = False
+    somr_log_chunk_size: t.ClassVar[int] = 64 * 1024
+    somr_log_limit: t.ClassVar[int] = 1024 * 1024
+    """max number of characters of the SoMR log to forward as debug message per slot"""
+    somr_spoiler_path: Path | None = None
+    """SoMR spoiler in somr_log_dir, which is kept until write_spoiler copied it"""
     somr_seed: str
     connect_name: str
     starting_characters: list[str]
     findable_characters: list[str]
     char_classes: dict[str, str]
-    starter_weapons: dict[str, ItemId]  # TODO: ItemID: ItemID?
+    starter_weapons: "dict[str, ItemId]"  # TODO: ItemID: ItemID?
+    logic: LogicTable
+    """requirements of all locations for batch evaluation, see get_reachable_locations"""
+    pool_items: "list[SoMItem]"
+    """items this world added to the item pool in create_items"""
 
     def __init__(self, multiworld: MultiWorld, player: int):
         super().__init__(multiworld, player)
@@ -138,27 +209,43 @@ class SoMWorld(World):
         self.findable_characters = []
         self.char_classes = {}
         self.starter_weapons = {}
+        self.logic = LogicTable(player)
+        self.pool_items = []
 
     def __del__(self) -> None:
         self.cleanup()
 
-    def cleanup(self) -> None:
+    def cleanup(self, keep_spoiler: bool = False) -> None:
         if self.somr_log_file is not None:
             self.flush_log()
             self.somr_log_file.close()
             self.somr_log_file = None
-        if self.somr_spoiler_file is not None:
-            self.somr_spoiler_file.close()
-            self.somr_spoiler_file = None
+        if self.somr_spoiler_path is not None and keep_spoiler:
+            return  # no file is open, the directory is removed once the spoiler was copied
+        self.somr_spoiler_path = None
         if self.somr_log_dir is not None:
             self.somr_log_dir.cleanup()
             self.somr_log_dir = None
 
     def flush_log(self, error: bool = False) -> None:
-        if self.somr_log_file is not None:
-            msg = self.somr_log_file.read()
-            if msg:
-                logging.log(logging.ERROR if error else logging.DEBUG, f"SoM for player {self.player}:\n{msg}")
+        """
+        Forwards new lines of the SoMR log in chunks. Nothing is read if the message would be discarded, so an error
+        includes everything since the last forwarded debug message. Debug messages are limited to somr_log_limit.
+        """
+        level = logging.ERROR if error else logging.DEBUG
+        if self.somr_log_file is None or not logging.getLogger().isEnabledFor(level):
+            return
+        while error or self.somr_log_forwarded < self.somr_log_limit:
+            lines = self.somr_log_file.readlines(self.somr_log_chunk_size)
+            if not lines:
+                return
+            msg = "".join(lines)
+            if not error:
+                self.somr_log_forwarded += len(msg)
+            logging.log(level, f"SoM for player {self.player}:\n{msg}")
+        if not self.somr_log_truncated:
+            self.somr_log_truncated = True
+            logging.log(level, f"SoM for player {self.player}: log limit of {self.somr_log_limit} characters reached")
 
     @classmethod
     def stage_assert_generate(cls, multiworld: MultiWorld) -> None:
@@ -171,69 +258,254 @@ class SoMWorld(World):
             raise FileNotFoundError(cls.settings.rom_file)
 
     def generate_early(self) -> None:
-        # create SoMR instance from options
+        # SoMR settings from options, SoMR itself is built in stage_generate_early
         require_pysomr()  # in case stage_assert_generate is skipped
 
-        from pysomr import OW
+        from importlib.metadata import version as metadata_version
 
         player_name = self.multiworld.get_player_name(self.player)
         self.connect_name = player_name[:32]
         while len(self.connect_name.encode("utf-8")) > 32:
             self.connect_name = self.connect_name[:-1]
-        self.somr_seed = "%08X" % (self.random.randint(0, 2**64 - 1),)
-        self.somr_log_dir = TemporaryDirectory(prefix="somr_")
-        generate_spoiler = True  # TODO: disable spoiler if generating with spoiler=0 or skip_output=True
-        somr_settings = {
-            "loggingDirectory": self.somr_log_dir.name,
-            "spoilerLog": "yes" if generate_spoiler else "no",
+        self.somr_seed = self.roll_somr_seed()
+        self.somr_settings = {
             "opMultiWorld": "yes",
             "opDisableHints": "yes",  # not supported yet
             "apSeed": self.multiworld.seed_name.encode("utf-8").hex(),
             "apConnectName": self.connect_name.encode("utf-8").hex(),
+            **get_somr_settings(self.options),
         }
-        for option_field in fields(self.options):
-            option = getattr(self.options, option_field.name)
-            if isinstance(option, SoMROptionProto):
-                somr_settings[option.somr_setting] = option.somr_value
-            else:
-                assert option_field in fields(PerGameCommonOptions), f"{option_field.name} neither common nor SoMR"
+
+        if self.settings.logic_cache:
+            self.logic_cache_key = get_cache_key(metadata_version("pysomr"), self.somr_seed, self.somr_settings)
+            logic_data = load_cached(self.logic_cache_key)
+            if logic_data is not None:
+                self.set_logic_data(logic_data)
+                return
+        self.logic_data_pending = True
+
+    @classmethod
+    def stage_generate_early(cls, multiworld: MultiWorld) -> None:
+        # build SoMR for all slots that did not hit the cache, in parallel if enabled
+        pending: list[SoMWorld] = []
+        for player in sorted(multiworld.get_game_players(cls.game)):
+            world = multiworld.worlds[player]
+            if isinstance(world, cls) and world.logic_data_pending:
+                pending.append(world)
+        if not pending:
+            return
+        mode = cls.settings.ow_build_mode
+        max_workers = min(len(pending), cls.settings.ow_build_workers or os.cpu_count() or 1)
+        # a failing slot does not stop the others, so a generation reports all failing slots at once
+        failures: list[tuple[SoMWorld, Exception]] = []
+        if mode == "serial" or max_workers < 2:
+            for world in pending:
+                try:
+                    world.set_logic_data(world.build_logic_data())
+                except Exception as e:
+                    failures.append((world, e))
+            cls.raise_build_failures(failures)
+            return
+        if mode not in ("threads", "processes"):
+            raise ValueError(f"Invalid ow_build_mode {mode}")
+
+        # results are applied in player order, so the outcome does not depend on which build finishes first
+        futures: list[Future[LogicData]] = []
+        rom_file = str(cls.settings.rom_file)
+        budget = cls.get_memory_budget()
+        with ExitStack() as executors:
+
+            def new_executor() -> Executor:
+                if mode == "threads":
+                    return executors.enter_context(ThreadPoolExecutor(max_workers, thread_name_prefix="SoMR"))
+                return executors.enter_context(ProcessPoolExecutor(max_workers, initializer=require_pysomr))
+
+            executor = new_executor()
+
+            def submit(world: SoMWorld) -> Future[LogicData]:
+                nonlocal executor
+                if mode == "threads":
+                    future = executor.submit(world.build_logic_data)
+                else:
+                    try:
+                        future = world.submit_logic_data(executor, budget, rom_file)
+                    except BrokenExecutor:
+                        # a worker process died, which breaks the pool for all of its futures
+                        executor = new_executor()
+                        future = world.submit_logic_data(executor, budget, rom_file)
+                futures.append(future)  # so it is cancelled on error
+                return future
+
+            def get_result(world: SoMWorld, future: Future[LogicData]) -> LogicData:
+                if mode == "threads":
+                    return future.result()
+                attempt = 0
+                while True:
+                    try:
+                        logic_data = future.result()
+                        break
+                    except Exception as e:
+                        world.open_log(e)
+                        world.release_ow()
+                        if not world.should_retry(e, attempt):
+                            raise
+                    attempt += 1
+                    future = submit(world)
+                world.open_log()
+                world.release_ow()
+                return logic_data
+
+            try:
+                for world in pending:
+                    submit(world)
+                for n, world in enumerate(pending):
+                    try:
+                        world.set_logic_data(get_result(world, futures[n]))
+                    except Exception as e:
+                        failures.append((world, e))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        cls.raise_build_failures(failures)
+
+    @staticmethod
+    def raise_build_failures(failures: "list[tuple[SoMWorld, Exception]]") -> None:
+        """Raises one error that names every slot SoMR could not be built for, with their errors."""
+        if failures:
+            names = ", ".join(world.multiworld.get_player_name(world.player) for world, _ in failures)
+            raise ExceptionGroup(f"Building SoMR failed for {names}", [error for _, error in failures])
+
+    def build_logic_data(self) -> LogicData:
+        """Builds the SoMR instance, returns what logic needs from it and frees it again."""
+        attempt = 0
+        while True:
+            try:
+                with self.reserve_ow_memory():
+                    try:
+                        return LogicData.from_ow(self.build_ow(generate_spoiler=False))
+                    finally:
+                        self.release_ow()
+            except Exception as e:
+                if not self.should_retry(e, attempt):
+                    raise
+            attempt += 1
+
+    def submit_logic_data(self, executor: Executor, budget: MemoryBudget, rom_file: str) -> "Future[LogicData]":
+        """Builds LogicData in a worker process. The OW stays in the worker, but the budget is for the process tree."""
+        somr_settings = self.open_log_dir(generate_spoiler=False)
+        ow_memory = estimate_ow_memory(rom_file)
+        budget.acquire(ow_memory)
+        try:
+            future = executor.submit(build_logic_data, rom_file, self.somr_seed, somr_settings)
+        except BaseException:
+            budget.release(ow_memory)
+            raise
+        future.add_done_callback(lambda _: budget.release(ow_memory))
+        return future
+
+    def roll_somr_seed(self) -> str:
+        return "%08X" % (self.random.randint(0, 2**64 - 1),)
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """
+        Returns True and switches to a new SoMR seed if building SoMR failed with one of retried_errors and retries are
+        left. Other errors, e.g. a missing ROM or SoMR rejecting the settings, would fail again and are not retried.
+        """
+        if attempt >= self.settings.ow_build_retries or not isinstance(error, self.retried_errors):
+            return False
+        from importlib.metadata import version as metadata_version
+
+        failed_seed = self.somr_seed
+        self.somr_seed = self.roll_somr_seed()
+        if self.logic_cache_key:
+            self.logic_cache_key = get_cache_key(metadata_version("pysomr"), self.somr_seed, self.somr_settings)
+        logging.warning(
+            f"SoM for player {self.player}: SoMR failed for seed {failed_seed} ({error}), "
+            f"retrying with seed {self.somr_seed} ({attempt + 1}/{self.settings.ow_build_retries})"
+        )
+        return True
+
+    @classmethod
+    def get_memory_budget(cls) -> MemoryBudget:
+        return get_memory_budget(cls.settings.somr_memory_budget)
+
+    def reserve_ow_memory(self) -> t.ContextManager[None]:
+        """Waits until a SoMR instance fits into the memory budget and reserves memory for it."""
+        return self.get_memory_budget().reserve(estimate_ow_memory(self.settings.rom_file))
+
+    def release_ow(self) -> None:
+        """Frees the SoMR instance, so memory does not scale with the number of SoM slots during fill."""
+        self.ow = None
+        self.cleanup(keep_spoiler=True)
+
+    def set_logic_data(self, logic_data: LogicData) -> None:
+        """Applies what SoMR decided to the world, stores it in the cache if it was built."""
+        from .gen import ItemId
+
+        if self.logic_data_pending and self.logic_cache_key:
+            store_cached(self.logic_cache_key, logic_data)
+        self.logic_data_pending = False
+        self.logic_data = logic_data
+        self.starting_characters = list(logic_data.starting_characters)
+        self.findable_characters = list(logic_data.findable_characters)
+        self.char_classes = dict(logic_data.char_classes)
+        self.starter_weapons = {char: ItemId(weapon) for char, weapon in logic_data.starter_weapons.items()}
+
+    def build_ow(self, generate_spoiler: bool = True) -> "OW":
+        """Creates the SoMR instance from somr_settings. Opens SoMR log and spoiler."""
+        from pysomr import OW
+
+        # TODO: disable spoiler if generating with spoiler=0 or skip_output=True
+        somr_settings = self.open_log_dir(generate_spoiler)
+        assert self.somr_log_dir is not None
 
         try:
-            self.ow = OW(self.settings.rom_file, self.somr_seed, somr_settings)
-            self.somr_log_file = open(Path(self.somr_log_dir.name) / f"log_{self.somr_seed}.txt")
+            ow = OW(self.settings.rom_file, self.somr_seed, somr_settings)
         except Exception as e:
-            try:
-                # flush SoMR log as error if the error is most likely coming from SoMR
-                self.somr_log_file = open(Path(self.somr_log_dir.name) / f"log_{self.somr_seed}.txt")
-                if not isinstance(e, (FileNotFoundError, PermissionError, OSError)):
-                    self.flush_log(error=True)
-            except FileNotFoundError:
-                pass
+            self.open_log(e)
             raise
 
-        self.flush_log()
+        self.open_log()
         if generate_spoiler:
-            self.somr_spoiler_file = open(Path(self.somr_log_dir.name) / f"log_{self.somr_seed}_SPOILER.txt")
-        # try to delete temp folder early, which works on Linux, but fails on Windows
-        try:
-            self.somr_log_dir.cleanup()
-        except (FileNotFoundError, OSError, PermissionError):
-            pass
+            self.somr_spoiler_path = Path(self.somr_log_dir.name) / f"log_{self.somr_seed}_SPOILER.txt"
+        else:
+            # try to delete temp folder early, which works on Linux, but fails on Windows
+            try:
+                self.somr_log_dir.cleanup()
+            except (FileNotFoundError, OSError, PermissionError):
+                pass
+        self.ow = ow
+        return ow
 
-        working_data = self.ow.context.working_data
-        for char in ("boy", "girl", "sprite"):
-            exists = working_data.get_bool(character_exists_keys[char].value)
-            if exists:
-                find = working_data.get_bool(character_in_logic_keys[char].value)
-                if find:
-                    self.findable_characters.append(char)
-                else:
-                    self.starting_characters.append(char)
-                weapon_index = working_data.get_int(character_starter_weapon_keys[char].value)
-                self.starter_weapons[char] = ItemId(ItemId.glove + weapon_index)
-            self.char_classes[char] = working_data[character_class_keys[char].value]
+    def open_log_dir(self, generate_spoiler: bool) -> dict[str, str]:
+        """Creates a temporary directory for SoMR logs and returns the settings to build SoMR that logs there."""
+        self.somr_log_dir = TemporaryDirectory(prefix="somr_")
+        return {
+            **self.somr_settings,
+            "loggingDirectory": self.somr_log_dir.name,
+            "spoilerLog": "yes" if generate_spoiler else "no",
+        }
+
+    def open_log(self, error: Exception | None = None) -> None:
+        """Opens and forwards the SoMR log after building SoMR. Pass the exception if building failed."""
+        assert self.somr_log_dir is not None
+        log_path = Path(self.somr_log_dir.name) / f"log_{self.somr_seed}.txt"
+        if error is None:
+            self.somr_log_file = open(log_path)
+            self.flush_log()
+            return
+        try:
+            self.somr_log_file = open(log_path)
+        except FileNotFoundError:
+            return
+        # flush SoMR log as error if the error is most likely coming from SoMR
+        if not isinstance(error, (FileNotFoundError, PermissionError, OSError)):
+            self.flush_log(error=True)
 
     def create_regions(self) -> None:
+        from .gen import LocationId
+
         # TODO: generate *some* regions from locations' requirements?
         menu = Region("Menu", self.player, self.multiworld)
         self.multiworld.regions += [menu]
@@ -241,52 +513,46 @@ class SoMWorld(World):
         # create ingame region
         ingame = Region("Ingame", self.player, self.multiworld)
 
-        magic_exists: set[str] = set()
         # findable character side effects
         for char in self.findable_characters:
-            rule = self.make_char_rule(char)
+            rule = self.logic.get_rule((char,))
             caster = spell_progression[self.char_classes[char]]
             weapon = self.starter_weapons[char]
-            if caster != "noCaster":
-                magic_exists.add(caster)
-            self.add_event(ingame, f"{char} spells", caster, rule)
-            self.add_location(ingame, self.location_name_to_id[f"{char} starter weapon"], weapon, rule)
+            self.logic.add(self.add_event(ingame, f"{char} spells", caster, rule), (char,))
+            weapon_location_id = self.location_name_to_id[f"{char} starter weapon"]
+            self.logic.add(self.add_location(ingame, weapon_location_id, weapon, rule), (char,))
 
         # "any magic" event
-        for char in self.starting_characters:
-            caster = spell_progression[self.char_classes[char]]
-            if caster != "noCaster":
-                magic_exists.add(caster)
-        if magic_exists:
-            any_caster_requirements = sorted(magic_exists)
-            self.add_event(ingame, f"any spells", "anyCaster", self.make_location_rule(any_caster_requirements))
+        any_caster_requirements = self.get_any_caster_requirements()
+        if any_caster_requirements:
+            any_caster_rule = self.make_location_rule(any_caster_requirements)
+            self.logic.add(self.add_event(ingame, f"any spells", "anyCaster", any_caster_rule), any_caster_requirements)
 
         # actual locations
-        for location in self.ow.generator.get_locations():
-            location_id = location.id
+        for location_id, somr_requirements in self.logic_data.locations:
             if location_id < LocationId.mech_rider3:
                 continue
-            location_rule = self.make_location_rule(location.requirements)
-            self.add_location(ingame, location_id, None, location_rule)
+            requirements = normalize_requirements(somr_requirements)
+            location_rule = self.make_location_rule(requirements)
+            self.logic.add(self.add_location(ingame, location_id, None, location_rule), requirements)
 
         goal_rule: t.Callable[[CollectionState], bool]
         if self.options.goal == Goal.option_mana_tree_revival:
             flammie_drum_logic = self.options.flammie_drum == self.options.flammie_drum.option_find
-            required_seeds = self.ow.context.working_data.get_int("manaSeedsRequired")
-            all_seeds = sorted((item_name for item_name in self.item_names if item_name.endswith(" seed")))
+            required_seeds = self.logic_data.mana_seeds_required
 
             if flammie_drum_logic:
 
                 def rule(state: CollectionState) -> bool:
-                    return state.has("flammie drum", self.player) and state.has_from_list(
-                        all_seeds, self.player, required_seeds
+                    return (
+                        state.has("flammie drum", self.player) and get_seed_count(state, self.player) >= required_seeds
                     )
 
                 goal_rule = rule
             else:
 
                 def rule(state: CollectionState) -> bool:
-                    return state.has_from_list(all_seeds, self.player, required_seeds)
+                    return get_seed_count(state, self.player) >= required_seeds
 
                 goal_rule = rule
         else:
@@ -296,51 +562,140 @@ class SoMWorld(World):
         self.add_event(ingame, "Done", "Did the thing", goal_rule)
         menu.connect(ingame, "New Game")
 
+    def get_any_caster_requirements(self) -> tuple[str, ...]:
+        """Returns what the "any spells" event requires, i.e. the casters of all existing characters, or () if none."""
+        magic_exists: set[str] = set()
+        for char in self.starting_characters + self.findable_characters:
+            caster = spell_progression[self.char_classes[char]]
+            if caster != "noCaster":
+                magic_exists.add(caster)
+        return normalize_requirements(magic_exists)
+
     def create_items(self) -> None:
-        items: list[SoMItem] = []
+        from .gen import ItemId
+
         for char in self.starting_characters:
             self.multiworld.push_precollected(self._create_item(getattr(ItemId, char)))
             self.multiworld.push_precollected(self._create_item(self.starter_weapons[char]))
             caster = spell_progression[self.char_classes[char]]
             self.multiworld.push_precollected(self.create_event_reward(caster))
-        for item in self.ow.generator.get_items():
-            item_id: int = item.id
-            if ItemId.nothing < item_id < ItemId.glove_orb:  # ignore internal-only items
-                continue
-            items.append(self._create_item(item_id))
-        self.multiworld.itempool += items
+        # ignore internal-only items
+        self.pool_items = self._create_items(
+            item_id for item_id in self.logic_data.items if not ItemId.nothing < item_id < ItemId.glove_orb
+        )
+        self.multiworld.itempool += self.pool_items
 
     def set_rules(self) -> None:
         self.multiworld.completion_condition[self.player] = lambda state: state.has("Did the thing", self.player)
 
-    def generate_basic(self) -> None:
-        pass  # TODO: maybe nothing? but we could place locked items and/or events here
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        if super().collect(state, item):
+            update_fingerprint(state, self.player, item.name)
+            return True
+        return False
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        if super().remove(state, item):
+            update_fingerprint(state, self.player, item.name)
+            return True
+        return False
+
+    def get_reachable_locations(self, state: CollectionState, include_checked: bool = False) -> list[Location]:
+        """
+        Returns the locations of this world that are reachable in state, evaluating all of them in one pass.
+        Unless include_checked is set, only locations that are not in state.locations_checked are returned.
+        The goal event is not included.
+        """
+        reachable = self.logic.get_reachable(state)
+        if include_checked:
+            return list(reachable)  # a copy, so callers can not modify the memoized result
+        return [location for location in reachable if location not in state.locations_checked]
+
+    @classmethod
+    def stage_generate_basic(cls, multiworld: MultiWorld) -> None:
+        # one pass over the item pool for all SoM slots, to see what is still in it and to remove what was placed
+        pool_ids = {id(item) for item in multiworld.itempool}
+        placed_ids: set[int] = set()
+        for player in sorted(multiworld.get_game_players(cls.game)):
+            world = multiworld.worlds[player]
+            if isinstance(world, cls):
+                placed_ids.update(map(id, world.place_forced_items(pool_ids)))
+        if placed_ids:
+            multiworld.itempool[:] = [item for item in multiworld.itempool if id(item) not in placed_ids]
+
+    def place_forced_items(self, pool_ids: t.Container[int]) -> list[Item]:
+        """
+        Places unique local progression items that have only one legal location left, so fill does not have to.
+        pool_ids are the ids of the items that are still in the item pool. Returns the placed items, which the caller
+        has to remove from the item pool.
+        A location is not legal for an item if it always requires that item. This ignores what an item is needed for
+        indirectly, e.g. a location that requires spriteCaster is still legal for sprite, so "legal" over-approximates
+        and an item is only placed if even the over-approximation leaves one location.
+        """
+        local_items = self.options.local_items.value
+        own_items = [item for item in self.pool_items if id(item) in pool_ids]
+        counts = Counter(item.name for item in own_items)
+        candidates = [
+            item for item in own_items if item.advancement and item.name in local_items and counts[item.name] == 1
+        ]
+        placed_items: list[Item] = []
+        placed = True
+        while placed and candidates:
+            # placing an item takes a location away from the others, so repeat until nothing changes
+            placed = False
+            for item in list(candidates):
+                legal = [
+                    location
+                    for location in self.logic.get_candidate_locations(item.name)
+                    if location.address is not None
+                    and location.item is None
+                    and location.progress_type != LocationProgressType.EXCLUDED
+                    and location.item_rule(item)
+                ]
+                if len(legal) == 1:
+                    legal[0].place_locked_item(item)
+                    placed_items.append(item)
+                    candidates.remove(item)
+                    placed = True
+        return placed_items
 
     def generate_output(self, output_directory: str) -> None:
-        working_data = self.ow.context.working_data
-        for location in self.multiworld.get_locations(self.player):
-            item = location.item
-            if item is not None and item.player != self.player:
-                item_valid = item.name.isascii()
-                receiver_name = self.multiworld.player_name.get(item.player, None)
-                receiver_valid = receiver_name and receiver_name.isascii()
-                if item_valid and receiver_valid:
-                    message = f"Sent {item.name} to {receiver_name}!"
-                elif item_valid:
-                    message = f"Sent {item.name} to someone else!"
-                elif receiver_valid:
-                    message = f"{receiver_name} got your item!"
-                else:
-                    message = f"Someone else got your item!"
-                working_data[f"mwRewardMessage{location.address}"] = message
+        with self.reserve_ow_memory():
+            self.write_output(output_directory)
+
+    def write_output(self, output_directory: str) -> None:
+        """Builds SoMR, patches the ROM and writes the patch file."""
+        # SoMR is rebuilt from seed and settings, which has to give the same result as in generate_early
+        ow = self.build_ow()
         out_base = output_path(output_directory, self.multiworld.get_out_file_name_base(self.player))
         out_file = out_base + SoMDeltaPatch.result_file_ending
         patch_file = out_base + SoMDeltaPatch.patch_file_ending
         try:
-            self.ow.run(out_file)
+            if LogicData.from_ow(ow) != self.logic_data:
+                cache_hint = " or the logic cache is stale" if self.logic_cache_key else ""
+                raise ValueError(
+                    f"SoM for player {self.player}: SoMR built for output differs from the logic used for fill, "
+                    f"SoMR is not deterministic for seed {self.somr_seed}{cache_hint}"
+                )
+            working_data = ow.context.working_data
+            for location in self.multiworld.get_locations(self.player):
+                item = location.item
+                if item is not None and item.player != self.player:
+                    item_valid = item.name.isascii()
+                    receiver_name = self.multiworld.player_name.get(item.player, None)
+                    receiver_valid = receiver_name and receiver_name.isascii()
+                    if item_valid and receiver_valid:
+                        message = f"Sent {item.name} to {receiver_name}!"
+                    elif item_valid:
+                        message = f"Sent {item.name} to someone else!"
+                    elif receiver_valid:
+                        message = f"{receiver_name} got your item!"
+                    else:
+                        message = f"Someone else got your item!"
+                    working_data[f"mwRewardMessage{location.address}"] = message
+            ow.run(out_file)
             self.flush_log()
-            # NOTE: we currently can not add an extra .txt file to the zip
-            # TODO: append (parts of) the SoMR spoiler to AP spoiler
+            # NOTE: we currently can not add an extra .txt file to the zip, the SoMR spoiler is added in write_spoiler
             SoMDeltaPatch(patch_file, player=self.player, player_name=self.player_name, patched_path=out_file).write()
         except Exception as e:
             # flush SoMR log as error if the error is most likely coming from SoMR
@@ -352,7 +707,57 @@ class SoMWorld(World):
                 os.unlink(out_file)
             except FileNotFoundError:
                 pass
-            self.cleanup()
+            del ow
+            self.release_ow()
+
+    def fill_slot_data(self) -> dict[str, t.Any]:
+        """Exports the slot's logic as compact interned tables, so trackers do not have to run SoMR."""
+        from .gen import LocationId
+
+        chars = ("boy", "girl", "sprite")
+        classes = sorted(set(self.char_classes.values()))
+        locations = [
+            (location_id, normalize_requirements(requirements))
+            for location_id, requirements in self.logic_data.locations
+            if location_id >= LocationId.mech_rider3
+        ]
+        locations += [
+            (self.location_name_to_id[f"{char} starter weapon"], (char,)) for char in self.findable_characters
+        ]
+        return {
+            "logic_version": 1,
+            "characters": chars,
+            "classes": classes,
+            # exists, find, class index, starter weapon item ID (0 if the character does not exist)
+            "character_data": [
+                [
+                    int(char in self.starting_characters or char in self.findable_characters),
+                    int(char in self.findable_characters),
+                    classes.index(self.char_classes[char]),
+                    int(self.starter_weapons.get(char, 0)),
+                ]
+                for char in chars
+            ],
+            # caster item per class, collecting a character grants the caster of its class
+            "class_casters": [spell_progression[char_class] for char_class in classes],
+            # requirements of anyCaster, empty if nobody can cast, i.e. anyCaster can not be fulfilled
+            "any_caster": list(self.get_any_caster_requirements()),
+            "mana_seeds_required": self.logic_data.mana_seeds_required,
+            "goal": self.get_goal_data(),
+            "requirements": export_requirements(locations),
+        }
+
+    def get_goal_data(self) -> dict[str, t.Any]:
+        """
+        Returns the goal rule of create_regions for slot data: Mana Tree Revival requires mana_seeds_required seeds
+        and, if flammie_drum is set, Flammie Drum. Vanilla goals require what location requires.
+        """
+        from .gen import LocationId
+
+        if self.options.goal == Goal.option_mana_tree_revival:
+            flammie_drum = self.options.flammie_drum == self.options.flammie_drum.option_find
+            return {"goal": self.options.goal.current_key, "flammie_drum": flammie_drum, "location": None}
+        return {"goal": self.options.goal.current_key, "flammie_drum": False, "location": int(LocationId.dread_slime)}
 
     def modify_multidata(self, multidata: t.Mapping[str, t.Any]) -> None:
         # we skip in case of error, so that the original error in the output thread is the one that gets raised
@@ -377,32 +782,21 @@ class SoMWorld(World):
                     self.item_id_to_name[self.starter_weapons[char]],
                 ]
             spoiler_handle.write(f"{char + ':':32} {', '.join(char_details)}\n")
+        for name, element in self.logic_data.orb_elements.items():
+            element_name = element_names.get(element, "None")
+            spoiler_handle.write(f"{name + ' orb:':32} {element_name}\n")
+
+    def write_spoiler(self, spoiler_handle: t.TextIO) -> None:
+        if self.somr_spoiler_path is None:
+            return
         try:
-            working_data = self.ow.context.working_data
-            orbs = {  # TODO: move to gen.py, or just include the SoMR spoiler for this?
-                "matango": 307,
-                "earth palace": 291,
-                "first fire palace": 348,
-                "second fire palace": 240,
-                "third fire palace": 345,
-                "moon palace": 35,
-                "upperland": 41,
-                "grand palace 1": 420,
-                "grand palace 2": 421,
-                "grand palace 3": 422,
-                "grand palace 4": 423,
-                "grand palace 5": 424,
-                "grand palace 6": 425,
-                "grand palace 7": 426,
-            }
-            element_names = ["Gnome", "Undine", "Salamando", "Lumina", "Sylphid", "Shade", "Luna", "Dryad"]  # 0x81..
-            prefix = "orbElement"
-            for name, map_num in orbs.items():
-                element = working_data.get_int(prefix + str(map_num))
-                element_name = "None" if element in (0, 0xFF) else element_names[element - 0x81]
-                spoiler_handle.write(f"{name + ' orb:':32} {element_name}\n")
-        except Exception as e:
-            spoiler_handle.write(f"Could not write orb elements: {e.__class__.__name__}\n")
+            sections = [section for section in self.settings.somr_spoiler_sections.split(",") if section.strip()]
+            if [section.strip().lower() for section in sections] != ["none"]:
+                spoiler_handle.write(f"\n\nSoMR Spoiler for {self.player_name}:\n\n")
+                with open(self.somr_spoiler_path) as spoiler_file:
+                    copy_spoiler(spoiler_file, spoiler_handle, sections)
+        finally:
+            self.cleanup()
 
     # item and location helpers
 
@@ -410,113 +804,16 @@ class SoMWorld(World):
         location_name = self.location_id_to_name[location_id]
         return self.multiworld.get_location(location_name, self.player)
 
-    def make_char_rule(self, char: str) -> t.Callable[[CollectionState], bool]:
-        def rule(state: CollectionState) -> bool:
-            return state.has(char, self.player)
-
-        return rule
-
     def make_location_rule(self, requirements: t.Iterable[str]) -> t.Callable[[CollectionState], bool] | None:
-        assert not isinstance(requirements, str), "requirements must be a collection of strings, not string"
-        if not isinstance(requirements, list):
-            # convert SoMR.StrList to list[str]
-            requirements = list(requirements)
-        requirements = [req for req in requirements if req != "no spells"]  # remove irrelevant requirements
-
-        # girlCaster and spriteCaster is missing from requirements in SoMR from most locations
-        sprite_only_spells = ("undine spells", "gnome spells", "shade spells", "luna spells", "dryad spells")
-        girl_only_spells = ("lumina spells",)
-        either_spells = ("sylphid spells", "salamando spells")
-        if "spriteCaster" not in requirements:
-            for spells in sprite_only_spells:
-                if spells in requirements:
-                    requirements.append("spriteCaster")
-                    break
-        if "girlCaster" not in requirements:
-            for spells in girl_only_spells:
-                if spells in requirements:
-                    requirements.append("girlCaster")
-                    break
-        if "girlCaster" not in requirements and "spriteCaster" not in requirements and "anyCaster" not in requirements:
-            for spells in either_spells:
-                if spells in requirements:
-                    requirements.append("anyCaster")
-                    break
-
-        if len(requirements) == 0:
-            return None
-
-        # special case single-requirement rules
-        if len(requirements) == 1:
-            if requirements[0] == "cuttingWeapon":
-
-                def rule(state: CollectionState) -> bool:
-                    return state.has_any(("axe", "sword"), self.player)
-
-                return rule
-
-            if requirements[0] == "elinee":
-
-                def rule(state: CollectionState) -> bool:
-                    return state.has("axe", self.player) or state.has_all(("whip", "sword"), self.player)
-
-                return rule
-
-            if requirements[0] == "matango":
-
-                def rule(state: CollectionState) -> bool:
-                    # FIXME: this should actually be `(axe and element) or flammie`,
-                    #        but SoMR does `(axe or flammie) and element`
-                    return state.has_any(("axe", "flammie drum"), self.player)
-
-                return rule
-
-            def rule(state: CollectionState) -> bool:
-                return state.has(requirements[0], self.player)
-
-            return rule
-
-        required_items = [req for req in requirements if req not in ("cuttingWeapon", "elinee", "matango")]
-        requires_cutting = "cuttingWeapon" in requirements
-        requires_elinee_access = "elinee" in requirements
-        requires_matango_access = "matango" in requirements
-        assert (
-            int(requires_cutting) + int(requires_elinee_access) + int(requires_matango_access) < 2
-        ), "Only one special requirement should exist per location"
-
-        if requires_cutting:
-
-            def rule(state: CollectionState) -> bool:
-                return state.has_all(required_items, self.player) and state.has_any(("axe", "sword"), self.player)
-
-            return rule
-
-        if requires_elinee_access:
-
-            def rule(state: CollectionState) -> bool:
-                return state.has_all(required_items, self.player) and (
-                    state.has("axe", self.player) or state.has_all(("whip", "sword"), self.player)
-                )
-
-            return rule
-
-        if requires_matango_access:
-
-            def rule(state: CollectionState) -> bool:
-                return state.has_all(required_items, self.player) and state.has_any(
-                    ("axe", "flammie drum"), self.player
-                )
-
-            return rule
-
-        def regular_rule(state: CollectionState) -> bool:
-            return state.has_all(required_items, self.player)
-
-        return regular_rule
+        """
+        Returns an O(1) rule for SoMR requirements, checking the fingerprint kept up to date by collect/remove.
+        Locations with the same canonical requirements share the rule.
+        """
+        return self.logic.get_rule(normalize_requirements(requirements))
 
     def create_item(self, name: str) -> "Item":
         if name in ("nothing", "Nothing"):
-            return self._create_item(ItemId.nothing)
+            return self._create_item(0)
         return self._create_item(self.item_name_to_id[name])
 
     def _create_item(self, item_id: int | str) -> "SoMItem":
@@ -529,19 +826,25 @@ class SoMWorld(World):
             name = item_id
             item_id = self.item_name_to_id[name]
         else:
-            name = self.item_id_to_name[item_id]
+            name = t.cast(str, item_names_by_id[item_id])
         assert isinstance(item_id, int)
-        # NOTE: because all characters lock a weapon, all of them need to be marked as progression
-        prog = item_id in progression_items or item_id in character_items
+        # NOTE: classification is precomputed by generate_gen, see dump_item_classifications
         # TODO: seeds should only be a prog item if MTR or restrictive
-        useful = not prog and item_id in useful_items
-        classification = (
-            ItemClassification.progression
-            if prog
-            else ItemClassification.useful if useful else ItemClassification.filler
-        )
+        classification = item_classifications[item_id] if item_id >= 0 else ItemClassification.filler
         return SoMItem(name, classification, item_id, self.player)
 
+    def _create_items(self, item_ids: t.Iterable[int]) -> list["SoMItem"]:
+        """Bulk version of _create_item that skips all the per-item conversions for the item pool."""
+        player = self.player
+        items: list[SoMItem] = []
+        for item_id in item_ids:
+            if item_id == 0:
+                items.append(self._create_item(item_id))
+            else:
+                name = t.cast(str, item_names_by_id[item_id])
+                items.append(SoMItem(name, item_classifications[item_id], item_id, player))
+        return items
+
     def create_event_reward(self, name: str) -> "SoMItem":
         prog = name in progression_event_rewards
         classification = ItemClassification.progression if prog else ItemClassification.filler
@@ -553,10 +856,12 @@ class SoMWorld(World):
         location_name: str,
         item_name: str,
         rule: t.Callable[[CollectionState], bool] | None = None,
-    ) -> None:
+    ) -> Location:
         item = region.add_event(location_name, item_name, rule, SoMLocation, SoMItem)
         prog = item_name in progression_event_rewards
         item.classification = ItemClassification.progression if prog else ItemClassification.filler
+        assert item.location is not None
+        return item.location
 
     def add_location(
         self,
@@ -564,23 +869,24 @@ class SoMWorld(World):
         location_id: int,  # TODO: enum
         locked_item: "SoMItem | ItemId | None",
         rule: t.Callable[[CollectionState], bool] | None = None,
-    ) -> None:
+    ) -> "SoMLocation":
         if isinstance(locked_item, int):
             locked_item = self._create_item(locked_item)
         assert locked_item is None or isinstance(locked_item, SoMItem), "Invalid locked_item"
-        location = SoMLocation(self.player, self.location_id_to_name[location_id], location_id, region)
+        location = SoMLocation(self.player, t.cast(str, location_names_by_id[location_id]), location_id, region)
         if rule:
             location.access_rule = rule
         if locked_item is not None:
             location.place_locked_item(locked_item)
         region.locations.append(location)
+        return location
 
 
 class SoMItem(Item):
     game: str = SoMWorld.game
     __slots__ = ()  # disable __dict__
 
-    def __init__(self, name: str, classification: ItemClassification, code: ItemId | int | None, player: int):
+    def __init__(self, name: str, classification: ItemClassification, code: "ItemId | int | None", player: int):
         # convert ItemId to int for Item
         super().__init__(name, classification, None if code is None else int(code), player)
 
@@ -589,7 +895,7 @@ class SoMLocation(Location):
     game: str = SoMWorld.game
     __slots__ = ()  # disables __dict__ once Location has __slots__
 
-    def __init__(self, player: int, name: str, address: LocationId | int | None, parent: Region | None = None):
+    def __init__(self, player: int, name: str, address: "LocationId | int | None", parent: Region | None = None):
         # convert LocationId to int for Location
         super().__init__(player, name, None if address is None else int(address), parent)
 
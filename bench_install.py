@@ -0,0 +1,177 @@
+"""
+Measures how long a fresh process takes from importing the world's vendored package to having pysomr importable,
+i.e. what require_pysomr does: metadata lookup, vendored.install() (extraction and sys.path insertion), and import.
+Each run is a new interpreter with a throwaway cache directory, for both an unzipped and a zipped apworld.
+Requires vendored/ from vendor.py. Run with the interpreter to measure: python bench_install.py --help
+
+The child code re-implements require_pysomr's steps instead of calling it, so that the world and Archipelago are not
+imported and every step can be timed. Keep it in sync with require_pysomr, it can drift without anything failing.
+"""
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import typing as t
+import zipfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+__all__ = (
+    "main",
+    "make_package",
+    "run_once",
+    "summarize",
+)
+
+layouts = ("unzipped", "zipped")
+steps = ("import", "metadata_miss", "install", "metadata_hit", "import_pysomr", "total", "process")
+"""measured steps in order, total is in-process, process includes interpreter startup"""
+
+# runs in the child process: root package_name cache_dir
+_child_code = """
+import json, sys, time
+t0 = time.perf_counter()
+from pathlib import Path
+import importlib, platformdirs
+from importlib.metadata import version, PackageNotFoundError
+
+root, package_name, cache_dir = sys.argv[1:4]
+platformdirs.user_cache_path = lambda appname=None, *args, **kwargs: Path(cache_dir) / (appname or "")
+sys.path.insert(0, root)
+timings = {}
+t = time.perf_counter()
+vendored = importlib.import_module(package_name + ".vendored")
+timings["import"] = time.perf_counter() - t
+t = time.perf_counter()
+try:
+    version("pysomr")
+    preinstalled = True
+except PackageNotFoundError:
+    preinstalled = False
+timings["metadata_miss"] = time.perf_counter() - t
+extracted = not any(Path(cache_dir).rglob("*.installed"))
+t = time.perf_counter()
+vendored.install()
+timings["install"] = time.perf_counter() - t
+t = time.perf_counter()
+version("pysomr")
+timings["metadata_hit"] = time.perf_counter() - t
+t = time.perf_counter()
+importlib.import_module("pysomr")
+timings["import_pysomr"] = time.perf_counter() - t
+timings["total"] = time.perf_counter() - t0
+print(json.dumps({"timings": timings, "extracted": extracted, "preinstalled": preinstalled}))
+"""
+
+
+def make_package(world_dir: Path, dest: Path, zipped: bool) -> Path:
+    """
+    Copies the world's vendored package into dest as a package with an empty __init__, so the world itself (and
+    Archipelago) is not imported. Returns the sys.path entry, which is an .apworld file if zipped.
+    """
+    package_name = world_dir.name
+    vendored_dir = world_dir / "vendored"
+    if not (vendored_dir / "__init__.py").is_file():
+        raise FileNotFoundError(f"{vendored_dir} does not exist, run vendor.py first")
+    ignore = shutil.ignore_patterns("__pycache__", "*.py[cod]")
+    if not zipped:
+        shutil.copytree(vendored_dir, dest / package_name / "vendored", ignore=ignore)
+        (dest / package_name / "__init__.py").touch()
+        return dest
+    apworld = dest / f"{package_name}.apworld"
+    with zipfile.ZipFile(apworld, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"{package_name}/__init__.py", "")
+        for path in sorted(vendored_dir.rglob("*")):
+            if path.is_file() and "__pycache__" not in path.parts and path.suffix not in (".pyc", ".pyo"):
+                zf.write(path, f"{package_name}/{path.relative_to(world_dir).as_posix()}")
+    return apworld
+
+
+def run_once(root: Path, package_name: str, cache_dir: Path) -> dict[str, t.Any]:
+    """Runs the install steps in a new interpreter and returns its timings in seconds."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _child_code, str(root), package_name, str(cache_dir)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError(f"child failed:\n{proc.stderr}")
+    result: dict[str, t.Any] = json.loads(proc.stdout.strip().rsplit("\n", 1)[-1])
+    result["timings"]["process"] = elapsed
+    return result
+
+
+def summarize(runs: t.Sequence[dict[str, t.Any]]) -> dict[str, dict[str, float]]:
+    """Returns median and min per step in milliseconds."""
+    return {
+        step: {
+            "median_ms": round(statistics.median(run["timings"][step] for run in runs) * 1000, 3),
+            "min_ms": round(min(run["timings"][step] for run in runs) * 1000, 3),
+        }
+        for step in steps
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark cold and warm vendored pysomr installation.")
+    parser.add_argument("--world", default=str(Path(__file__).parent), help="world directory that has vendored/")
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh cache directories per layout")
+    parser.add_argument("--warm", type=int, default=3, help="number of warm runs per cache directory")
+    parser.add_argument("--json", action="store_true", help="print results as JSON, to compare across commits")
+    args = parser.parse_args(argv)
+
+    world_dir = Path(args.world).resolve()
+    results: dict[str, t.Any] = {
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "platform": platform.platform(),
+        "gil_disabled": not getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "repeat": args.repeat,
+        "warm": args.warm,
+        "layouts": {},
+    }
+    with TemporaryDirectory(prefix="som_bench_") as temp:
+        for layout in layouts:
+            layout_dir = Path(temp) / layout
+            layout_dir.mkdir()
+            root = make_package(world_dir, layout_dir, layout == "zipped")
+            cold: list[dict[str, t.Any]] = []
+            warm: list[dict[str, t.Any]] = []
+            for n in range(args.repeat):
+                cache_dir = Path(temp) / f"cache_{layout}_{n}"
+                cold.append(run_once(root, world_dir.name, cache_dir))
+                warm.extend(run_once(root, world_dir.name, cache_dir) for _ in range(args.warm))
+                shutil.rmtree(cache_dir)
+            if any(run["preinstalled"] for run in cold + warm):
+                print("pysomr is installed in this environment, use one without it", file=sys.stderr)
+                return 1
+            if not all(run["extracted"] for run in cold) or any(run["extracted"] for run in warm):
+                print("cold runs did not extract or warm runs did", file=sys.stderr)
+                return 1
+            results["layouts"][layout] = {"cold": summarize(cold), "warm": summarize(warm) if warm else None}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{results['python']} on {results['platform']}, {args.repeat} cold and {args.repeat * args.warm} warm runs")
+    print(f"{'layout':<10}{'phase':<6}" + "".join(f"{step:>15}" for step in steps))
+    for layout, phases in results["layouts"].items():
+        for phase, summary in phases.items():
+            if summary is not None:
+                values = "".join(f"{summary[step]['median_ms']:>13.1f}ms" for step in steps)
+                print(f"{layout:<10}{phase:<6}{values}")
+    print("median per step")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
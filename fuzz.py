@@ -0,0 +1,168 @@
+"""
+Generates solo SoM seeds with random options and reports slow combinations as YAML.
+Run from the Archipelago directory: python -m worlds.som.fuzz --help
+With --offline, a stand-in for pysomr is used, so neither pysomr nor the ROM is required.
+"""
+
+import json
+import random
+import sys
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+__all__ = (
+    "FuzzJob",
+    "FuzzResult",
+    "main",
+    "run_job",
+    "sample_options",
+)
+
+game_name = "Secret of Mana"
+gen_steps = (
+    "generate_early",
+    "create_regions",
+    "create_items",
+    "set_rules",
+    "connect_entrances",
+    "generate_basic",
+    "pre_fill",
+)
+
+
+@dataclass
+class FuzzJob:
+    seed: int
+    options: dict[str, t.Any]
+    offline: bool = False
+    output: bool = False
+
+
+@dataclass
+class FuzzResult:
+    job: FuzzJob
+    timings: dict[str, float] = field(default_factory=dict)
+    peak_memory: int | None = None
+    """max resident set size in bytes, None if not available"""
+    error: str | None = None
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.timings.values())
+
+
+def sample_options(rng: random.Random) -> dict[str, t.Any]:
+    """Returns random values for all SoM specific options."""
+    from Options import Range, PerGameCommonOptions
+
+    from .options import SoMOptions
+
+    common = t.get_type_hints(PerGameCommonOptions)
+    options: dict[str, t.Any] = {}
+    for name, option_type in t.get_type_hints(SoMOptions).items():
+        if name in common:
+            continue
+        if issubclass(option_type, Range):
+            options[name] = rng.randint(option_type.range_start, option_type.range_end)
+        else:
+            options[name] = option_type.name_lookup[rng.choice(sorted(option_type.name_lookup))]
+    return options
+
+
+def get_peak_memory() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_job(job: FuzzJob) -> FuzzResult:
+    """Generates a solo SoM seed for job and returns the time spent in each stage. Run in a fresh process."""
+    from Fill import distribute_items_restrictive
+    from worlds.AutoWorld import World, call_all, call_stage
+
+    from .test.bases import create_multiworld
+    from .test.fake_pysomr import install_fake_pysomr
+
+    if job.offline:
+        install_fake_pysomr()
+
+    result = FuzzResult(job)
+    multiworld = create_multiworld(job.seed, [job.options])
+
+    def timed(name: str, func: t.Callable[..., None], *args: t.Any) -> None:
+        start = time.perf_counter()
+        func(*args)
+        result.timings[name] = time.perf_counter() - start
+
+    try:
+        if not job.offline:
+            # stage_assert_generate requires the ROM
+            timed("assert_generate", call_stage, multiworld, "assert_generate")
+        for step in gen_steps:
+            if hasattr(World, step):
+                timed(step, call_all, multiworld, step)
+        timed("fill", distribute_items_restrictive, multiworld)
+        timed("post_fill", call_all, multiworld, "post_fill")
+        if job.output:
+            with TemporaryDirectory(prefix="som_fuzz_") as output_directory:
+                timed("generate_output", call_all, multiworld, "generate_output", output_directory)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.peak_memory = get_peak_memory()
+    return result
+
+
+def write_yaml(path: Path, result: FuzzResult) -> None:
+    """Writes the options of result as player YAML, with seed and timings as comments to reproduce it."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"# generate with --seed {result.job.seed}\n")
+        f.write(f"# timings: {json.dumps({k: round(v, 3) for k, v in result.timings.items()})}\n")
+        if result.peak_memory is not None:
+            f.write(f"# peak memory: {result.peak_memory // (1024 * 1024)} MiB\n")
+        if result.error:
+            f.write(f"# error: {json.dumps(result.error)}\n")
+        f.write("name: Fuzzer\n")
+        f.write(f"game: {game_name}\n")
+        f.write(f"{game_name}:\n")
+        for name, value in result.job.options.items():
+            f.write(f"  {name}: {json.dumps(value)}\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Find slow SoM option combinations.")
+    parser.add_argument("--count", type=int, default=100, help="number of generations")
+    parser.add_argument("--workers", type=int, default=0, help="number of worker processes, 0 for number of CPUs")
+    parser.add_argument("--budget", type=float, default=10.0, help="seconds after which a generation is slow")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the fuzzer itself")
+    parser.add_argument("--out", default="som_fuzz", help="directory to write YAMLs of slow or failed combinations")
+    parser.add_argument("--offline", action="store_true", help="use a stand-in for pysomr, no ROM required")
+    parser.add_argument("--output", action="store_true", help="include generate_output")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [FuzzJob(rng.randrange(2**63), sample_options(rng), args.offline, args.output) for _ in range(args.count)]
+    flagged = 0
+    # one process per job, so peak memory is per generation
+    with ProcessPoolExecutor(args.workers or None, max_tasks_per_child=1) as pool:
+        for n, result in enumerate(pool.map(run_job, jobs)):
+            print(json.dumps({**asdict(result), "total_time": result.total_time}))
+            if result.error or result.total_time > args.budget:
+                flagged += 1
+                write_yaml(out_dir / f"som_fuzz_{n}.yaml", result)
+    print(f"{flagged} of {len(jobs)} generations were slow or failed", file=sys.stderr)
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,11 @@
 # This file is auto-generated! DO NOT MODIFY BY HAND!
 
-from enum import Enum, IntEnum
+import typing as t
+
+from BaseClasses import ItemClassification
+
+if t.TYPE_CHECKING:
+    from .gen_enums import ItemId as ItemId, LocationId as LocationId, WorkingDataKey as WorkingDataKey
 
 item_name_to_id = {
     "nothing": 0,
@@ -153,237 +158,223 @@ location_name_to_id = {
     "sprite starter weapon": 270,
 }
 item_name_groups: dict[str, set[str]] = {}
-
-
-class WorkingDataKey(Enum):
-    BOY_CLASS = "boyClass"
-    GIRL_CLASS = "girlClass"
-    SPRITE_CLASS = "spriteClass"
-    BOY_EXISTS = "boyExists"
-    GIRL_EXISTS = "girlExists"
-    SPRITE_EXISTS = "spriteExists"
-    BOY_IN_LOGIC = "findBoy"
-    GIRL_IN_LOGIC = "findGirl"
-    SPRITE_IN_LOGIC = "findSprite"
-    BOY_START_WEAPON_INDEX = "boyStartWeapon"
-    GIRL_START_WEAPON_INDEX = "girlStartWeapon"
-    SPRITE_START_WEAPON_INDEX = "spriteStartWeapon"
-
-
-class ItemId(IntEnum):
-    nothing = 0
-    glove_orb = 4
-    sword_orb = 5
-    axe_orb = 6
-    spear_orb = 7
-    whip_orb = 8
-    bow_orb = 9
-    boomerang_orb = 10
-    javelin_orb = 11
-    boy = 12
-    girl = 13
-    sprite = 14
-    sea_hare_tail = 15
-    gold_tower_key = 16
-    midge_mallet = 17
-    moogle_belt = 18
-    flammie_drum = 19
-    water_seed = 21
-    earth_seed = 22
-    wind_seed = 23
-    fire_seed = 24
-    light_seed = 25
-    dark_seed = 26
-    moon_seed = 27
-    dryad_seed = 28
-    undine_spells = 29
-    gnome_spells = 30
-    sylphid_spells = 31
-    salamando_spells = 32
-    lumina_spells = 33
-    shade_spells = 34
-    luna_spells = 35
-    dryad_spells = 36
-    glove = 37
-    sword = 38
-    axe = 39
-    spear = 40
-    whip = 41
-    bow = 42
-    boomerang = 43
-    javelin = 44
-    gp0 = 50
-    gp1 = 51
-    gp2 = 52
-    gp3 = 53
-    gp4 = 54
-    gp5 = 55
-    gp6 = 56
-    gp7 = 57
-    gp8 = 58
-    gp9 = 59
-    gp10 = 60
-    gp11 = 61
-    gp12 = 62
-    gp13 = 63
-    gp14 = 64
-    gp15 = 65
-    gp16 = 66
-
-
-class LocationId(IntEnum):
-    mech_rider3 = 4
-    buffy = 5
-    dread_slime = 6
-    gnome_item1 = 7
-    gnome_item2 = 8
-    fire_seed = 9
-    luna_item1 = 10
-    luna_item2 = 11
-    kakkara = 12
-    lumina_spells = 13
-    lumina_seed = 14
-    chest_next_to_whip_chest = 15
-    shade_palace_glove_orb_chest = 16
-    sunken_continent_sword_orb_chest = 17
-    lumina_tower_axe_orb_chest = 18
-    fire_palace_axe_orb_chest = 19
-    lumina_tower_spear_orb_chest = 20
-    sunken_continent_boomerang_orb_chest = 21
-    fire_palace_chest1 = 22
-    fire_palace_chest2 = 23
-    santa = 24
-    shade_spells = 25
-    shade_seed = 26
-    thunder_gigas = 27
-    red_dragon = 28
-    blue_dragon = 29
-    mana_tree = 30
-    matango_flammie = 31
-    jehk = 32
-    hydra = 33
-    kettlekin = 34
-    shade_palace_chest = 35
-    luka_item1 = 36
-    luka_item2 = 37
-    sylphid_item1 = 38
-    sylphid_item2 = 39
-    whip_chest = 40
-    moogle_village_glove_orb_chest = 41
-    ice_castle_glove_orb_chest = 42
-    pandora_sword_orb_chest = 43
-    northtown_ruins_sword_orb_chest = 44
-    moogle_village_axe_orb_chest = 45
-    northtown_castle_axe_orb_chest = 46
-    northtown_ruins_spear_orb_chest = 47
-    pandora_spear_orb_chest = 48
-    santa_spear_orb_chest = 49
-    kilroy_whip_orb_chest = 50
-    northtown_castle_whip_orb_chest = 51
-    northtown_ruins_bow_orb_chest = 52
-    potos_chest = 53
-    pandora_chest1 = 54
-    pandora_chest2 = 55
-    pandora_chest3 = 56
-    pandora_chest4 = 57
-    magic_rope_chest = 58
-    northtown_castle_chest = 59
-    matango_inn_javelin_orb_chest = 60
-    watts = 61
-    undine_item1 = 62
-    undine_item2 = 63
-    salamando = 64
-    dryad_spells = 65
-    dryad_seed = 66
-    mara = 67
-    turtle_island = 68
-    dwarf_elder = 69
-    tropicallo_item1 = 70
-    tropicallo_item2 = 71
-    girl = 72
-    solar = 73
-    kilroy = 74
-    mantis_ant = 75
-    axe_beak = 76
-    snow_dragon = 77
-    dragon_worm = 78
-    doom_wall = 79
-    vampire = 80
-    mech_rider2 = 81
-    watermelon = 82
-    hexas = 83
-    wall_face = 84
-    metal_mantis = 85
-    jema_at_tasnica = 86
-    triple_tonpole = 87
-    sword_pedestal = 88
-    boy_starter_weapon = 268
-    girl_starter_weapon = 269
-    sprite_starter_weapon = 270
-
-
+item_names_by_id: tuple[str | None, ...] = (
+    "nothing",
+    *(None,) * 3,
+    "Glove orb",
+    "Sword orb",
+    "Axe orb",
+    "Spear orb",
+    "Whip orb",
+    "Bow orb",
+    "Boomerang orb",
+    "Javelin orb",
+    "boy",
+    "girl",
+    "sprite",
+    "sea hare tail",
+    "gold tower key",
+    "midge mallet",
+    "moogle belt",
+    "flammie drum",
+    None,
+    "water seed",
+    "earth seed",
+    "wind seed",
+    "fire seed",
+    "light seed",
+    "dark seed",
+    "moon seed",
+    "dryad seed",
+    "undine spells",
+    "gnome spells",
+    "sylphid spells",
+    "salamando spells",
+    "lumina spells",
+    "shade spells",
+    "luna spells",
+    "dryad spells",
+    "glove",
+    "sword",
+    "axe",
+    "spear",
+    "whip",
+    "bow",
+    "boomerang",
+    "javelin",
+    *(None,) * 5,
+    "GP 0",
+    "GP 1",
+    "GP 2",
+    "GP 3",
+    "GP 4",
+    "GP 5",
+    "GP 6",
+    "GP 7",
+    "GP 8",
+    "GP 9",
+    "GP 10",
+    "GP 11",
+    "GP 12",
+    "GP 13",
+    "GP 14",
+    "GP 15",
+    "GP 16",
+)
+location_names_by_id: tuple[str | None, ...] = (
+    *(None,) * 4,
+    "mech rider 3",
+    "buffy",
+    "dread slime",
+    "gnome item 1",
+    "gnome item 2",
+    "fire seed",
+    "luna item 1",
+    "luna item 2",
+    "kakkara",
+    "lumina spells",
+    "lumina seed",
+    "chest next to whip chest",
+    "shade palace glove orb chest",
+    "sunken continent sword orb chest",
+    "lumina tower axe orb chest",
+    "fire palace axe orb chest",
+    "lumina tower spear orb chest",
+    "sunken continent boomerang orb chest",
+    "fire palace chest 1",
+    "fire palace chest 2",
+    "santa",
+    "shade spells",
+    "shade seed",
+    "thunder gigas",
+    "red dragon",
+    "blue dragon",
+    "mana tree",
+    "matango flammie",
+    "jehk",
+    "hydra",
+    "kettlekin",
+    "shade palace chest",
+    "luka item 1",
+    "luka item 2",
+    "sylphid item 1",
+    "sylphid item 2",
+    "whip chest",
+    "moogle village glove orb chest",
+    "ice castle glove orb chest",
+    "pandora sword orb chest",
+    "northtown ruins sword orb chest",
+    "moogle village axe orb chest",
+    "northtown castle axe orb chest",
+    "northtown ruins spear orb chest",
+    "pandora spear orb chest",
+    "santa spear orb chest",
+    "kilroy whip orb chest",
+    "northtown castle whip orb chest",
+    "northtown ruins bow orb chest",
+    "potos chest",
+    "pandora chest 1",
+    "pandora chest 2",
+    "pandora chest 3",
+    "pandora chest 4",
+    "magic rope chest",
+    "northtown castle chest",
+    "matango inn javelin orb chest",
+    "watts",
+    "undine item 1",
+    "undine item 2",
+    "salamando",
+    "dryad spells",
+    "dryad seed",
+    "mara",
+    "turtle island",
+    "dwarf elder",
+    "tropicallo item1",
+    "tropicallo item2",
+    "girl",
+    "solar",
+    "kilroy",
+    "mantis ant",
+    "axe beak",
+    "snow dragon",
+    "dragon worm",
+    "doom wall",
+    "vampire",
+    "mech rider 2",
+    "watermelon",
+    "hexas",
+    "wall face",
+    "metal mantis",
+    "jema at tasnica",
+    "triple tonpole",
+    "sword pedestal",
+    *(None,) * 179,
+    "boy starter weapon",
+    "girl starter weapon",
+    "sprite starter weapon",
+)
 character_exists_keys = {
-    "boy": WorkingDataKey.BOY_EXISTS,
-    "girl": WorkingDataKey.GIRL_EXISTS,
-    "sprite": WorkingDataKey.SPRITE_EXISTS,
+    "boy": "boyExists",
+    "girl": "girlExists",
+    "sprite": "spriteExists",
 }
 character_in_logic_keys = {
-    "boy": WorkingDataKey.BOY_IN_LOGIC,
-    "girl": WorkingDataKey.GIRL_IN_LOGIC,
-    "sprite": WorkingDataKey.SPRITE_IN_LOGIC,
+    "boy": "findBoy",
+    "girl": "findGirl",
+    "sprite": "findSprite",
 }
 character_class_keys = {
-    "boy": WorkingDataKey.BOY_CLASS,
-    "girl": WorkingDataKey.GIRL_CLASS,
-    "sprite": WorkingDataKey.SPRITE_CLASS,
+    "boy": "boyClass",
+    "girl": "girlClass",
+    "sprite": "spriteClass",
 }
 character_starter_weapon_keys = {
-    "boy": WorkingDataKey.BOY_START_WEAPON_INDEX,
-    "girl": WorkingDataKey.GIRL_START_WEAPON_INDEX,
-    "sprite": WorkingDataKey.SPRITE_START_WEAPON_INDEX,
+    "boy": "boyStartWeapon",
+    "girl": "girlStartWeapon",
+    "sprite": "spriteStartWeapon",
 }
 spell_progression = {
     "OGboy": "noCaster",
     "OGgirl": "girlCaster",
     "OGsprite": "spriteCaster",
 }
-progression_items: frozenset[ItemId] = frozenset(
+progression_items: frozenset[int] = frozenset(
     (
-        ItemId.axe,
-        ItemId.sword,
-        ItemId.whip,
-        ItemId.water_seed,
-        ItemId.earth_seed,
-        ItemId.wind_seed,
-        ItemId.fire_seed,
-        ItemId.light_seed,
-        ItemId.dark_seed,
-        ItemId.moon_seed,
-        ItemId.dryad_seed,
-        ItemId.undine_spells,
-        ItemId.gnome_spells,
-        ItemId.sylphid_spells,
-        ItemId.salamando_spells,
-        ItemId.lumina_spells,
-        ItemId.shade_spells,
-        ItemId.luna_spells,
-        ItemId.dryad_spells,
-        ItemId.gold_tower_key,
-        ItemId.sea_hare_tail,
-        ItemId.flammie_drum,
+        39,  # axe
+        38,  # sword
+        41,  # whip
+        21,  # water_seed
+        22,  # earth_seed
+        23,  # wind_seed
+        24,  # fire_seed
+        25,  # light_seed
+        26,  # dark_seed
+        27,  # moon_seed
+        28,  # dryad_seed
+        29,  # undine_spells
+        30,  # gnome_spells
+        31,  # sylphid_spells
+        32,  # salamando_spells
+        33,  # lumina_spells
+        34,  # shade_spells
+        35,  # luna_spells
+        36,  # dryad_spells
+        16,  # gold_tower_key
+        15,  # sea_hare_tail
+        19,  # flammie_drum
     )
 )
-useful_items: frozenset[ItemId] = frozenset(
+useful_items: frozenset[int] = frozenset(
     (
-        ItemId.midge_mallet,
-        ItemId.moogle_belt,
+        17,  # midge_mallet
+        18,  # moogle_belt
     )
 )
-character_items: frozenset[ItemId] = frozenset(
+character_items: frozenset[int] = frozenset(
     (
-        ItemId.boy,
-        ItemId.girl,
-        ItemId.sprite,
+        12,  # boy
+        13,  # girl
+        14,  # sprite
     )
 )
 progression_event_rewards: frozenset[str] = frozenset(
@@ -394,3 +385,123 @@ progression_event_rewards: frozenset[str] = frozenset(
         "Did the thing",
     )
 )
+spell_casters = {
+    "undine spells": "spriteCaster",
+    "gnome spells": "spriteCaster",
+    "sylphid spells": "anyCaster",
+    "salamando spells": "anyCaster",
+    "lumina spells": "girlCaster",
+    "shade spells": "spriteCaster",
+    "luna spells": "spriteCaster",
+    "dryad spells": "spriteCaster",
+}
+compound_requirements: dict[str, list[list[str]]] = {
+    "cuttingWeapon": [["axe"], ["sword"]],
+    "elinee": [["axe"], ["whip", "sword"]],
+    "matango": [["axe"], ["flammie drum"]],
+    "no spells": [[]],
+}
+item_classifications: tuple[ItemClassification, ...] = (
+    ItemClassification.filler,  # nothing
+    ItemClassification.filler,  # unused
+    ItemClassification.filler,  # unused
+    ItemClassification.filler,  # unused
+    ItemClassification.filler,  # glove_orb
+    ItemClassification.filler,  # sword_orb
+    ItemClassification.filler,  # axe_orb
+    ItemClassification.filler,  # spear_orb
+    ItemClassification.filler,  # whip_orb
+    ItemClassification.filler,  # bow_orb
+    ItemClassification.filler,  # boomerang_orb
+    ItemClassification.filler,  # javelin_orb
+    ItemClassification.progression,  # boy
+    ItemClassification.progression,  # girl
+    ItemClassification.progression,  # sprite
+    ItemClassification.progression,  # sea_hare_tail
+    ItemClassification.progression,  # gold_tower_key
+    ItemClassification.useful,  # midge_mallet
+    ItemClassification.useful,  # moogle_belt
+    ItemClassification.progression,  # flammie_drum
+    ItemClassification.filler,  # unused
+    ItemClassification.progression,  # water_seed
+    ItemClassification.progression,  # earth_seed
+    ItemClassification.progression,  # wind_seed
+    ItemClassification.progression,  # fire_seed
+    ItemClassification.progression,  # light_seed
+    ItemClassification.progression,  # dark_seed
+    ItemClassification.progression,  # moon_seed
+    ItemClassification.progression,  # dryad_seed
+    ItemClassification.progression,  # undine_spells
+    ItemClassification.progression,  # gnome_spells
+    ItemClassification.progression,  # sylphid_spells
+    ItemClassification.progression,  # salamando_spells
+    ItemClassification.progression,  # lumina_spells
+    ItemClassification.progression,  # shade_spells
+    ItemClassification.progression,  # luna_spells
+    ItemClassification.progression,  # dryad_spells
+    ItemClassification.filler,  # glove
+    ItemClassification.progression,  # sword
+    ItemClassification.progression,  # axe
+    ItemClassification.filler,  # spear
+    ItemClassification.progression,  # whip
+    ItemClassification.filler,  # bow
+    ItemClassification.filler,  # boomerang
+    ItemClassification.filler,  # javelin
+    ItemClassification.filler,  # unused
+    ItemClassification.filler,  # unused
+    ItemClassification.filler,  # unused
+    ItemClassification.filler,  # unused
+    ItemClassification.filler,  # unused
+    ItemClassification.filler,  # gp0
+    ItemClassification.filler,  # gp1
+    ItemClassification.filler,  # gp2
+    ItemClassification.filler,  # gp3
+    ItemClassification.filler,  # gp4
+    ItemClassification.filler,  # gp5
+    ItemClassification.filler,  # gp6
+    ItemClassification.filler,  # gp7
+    ItemClassification.filler,  # gp8
+    ItemClassification.filler,  # gp9
+    ItemClassification.filler,  # gp10
+    ItemClassification.filler,  # gp11
+    ItemClassification.filler,  # gp12
+    ItemClassification.filler,  # gp13
+    ItemClassification.filler,  # gp14
+    ItemClassification.filler,  # gp15
+    ItemClassification.filler,  # gp16
+)
+orb_element_keys = {
+    "matango": "orbElement307",
+    "earth palace": "orbElement291",
+    "first fire palace": "orbElement348",
+    "second fire palace": "orbElement240",
+    "third fire palace": "orbElement345",
+    "moon palace": "orbElement35",
+    "upperland": "orbElement41",
+    "grand palace 1": "orbElement420",
+    "grand palace 2": "orbElement421",
+    "grand palace 3": "orbElement422",
+    "grand palace 4": "orbElement423",
+    "grand palace 5": "orbElement424",
+    "grand palace 6": "orbElement425",
+    "grand palace 7": "orbElement426",
+}
+element_names: dict[int, str] = {
+    129: "Gnome",
+    130: "Undine",
+    131: "Salamando",
+    132: "Lumina",
+    133: "Sylphid",
+    134: "Shade",
+    135: "Luna",
+    136: "Dryad",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    # enums are only built on first use, see gen_enums.py
+    if name in ("ItemId", "LocationId", "WorkingDataKey"):
+        from . import gen_enums
+
+        return getattr(gen_enums, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
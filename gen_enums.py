@@ -0,0 +1,170 @@
+# This file is auto-generated! DO NOT MODIFY BY HAND!
+
+from enum import Enum, IntEnum
+
+
+class WorkingDataKey(Enum):
+    BOY_CLASS = "boyClass"
+    GIRL_CLASS = "girlClass"
+    SPRITE_CLASS = "spriteClass"
+    BOY_EXISTS = "boyExists"
+    GIRL_EXISTS = "girlExists"
+    SPRITE_EXISTS = "spriteExists"
+    BOY_IN_LOGIC = "findBoy"
+    GIRL_IN_LOGIC = "findGirl"
+    SPRITE_IN_LOGIC = "findSprite"
+    BOY_START_WEAPON_INDEX = "boyStartWeapon"
+    GIRL_START_WEAPON_INDEX = "girlStartWeapon"
+    SPRITE_START_WEAPON_INDEX = "spriteStartWeapon"
+
+
+class ItemId(IntEnum):
+    nothing = 0
+    glove_orb = 4
+    sword_orb = 5
+    axe_orb = 6
+    spear_orb = 7
+    whip_orb = 8
+    bow_orb = 9
+    boomerang_orb = 10
+    javelin_orb = 11
+    boy = 12
+    girl = 13
+    sprite = 14
+    sea_hare_tail = 15
+    gold_tower_key = 16
+    midge_mallet = 17
+    moogle_belt = 18
+    flammie_drum = 19
+    water_seed = 21
+    earth_seed = 22
+    wind_seed = 23
+    fire_seed = 24
+    light_seed = 25
+    dark_seed = 26
+    moon_seed = 27
+    dryad_seed = 28
+    undine_spells = 29
+    gnome_spells = 30
+    sylphid_spells = 31
+    salamando_spells = 32
+    lumina_spells = 33
+    shade_spells = 34
+    luna_spells = 35
+    dryad_spells = 36
+    glove = 37
+    sword = 38
+    axe = 39
+    spear = 40
+    whip = 41
+    bow = 42
+    boomerang = 43
+    javelin = 44
+    gp0 = 50
+    gp1 = 51
+    gp2 = 52
+    gp3 = 53
+    gp4 = 54
+    gp5 = 55
+    gp6 = 56
+    gp7 = 57
+    gp8 = 58
+    gp9 = 59
+    gp10 = 60
+    gp11 = 61
+    gp12 = 62
+    gp13 = 63
+    gp14 = 64
+    gp15 = 65
+    gp16 = 66
+
+
+class LocationId(IntEnum):
+    mech_rider3 = 4
+    buffy = 5
+    dread_slime = 6
+    gnome_item1 = 7
+    gnome_item2 = 8
+    fire_seed = 9
+    luna_item1 = 10
+    luna_item2 = 11
+    kakkara = 12
+    lumina_spells = 13
+    lumina_seed = 14
+    chest_next_to_whip_chest = 15
+    shade_palace_glove_orb_chest = 16
+    sunken_continent_sword_orb_chest = 17
+    lumina_tower_axe_orb_chest = 18
+    fire_palace_axe_orb_chest = 19
+    lumina_tower_spear_orb_chest = 20
+    sunken_continent_boomerang_orb_chest = 21
+    fire_palace_chest1 = 22
+    fire_palace_chest2 = 23
+    santa = 24
+    shade_spells = 25
+    shade_seed = 26
+    thunder_gigas = 27
+    red_dragon = 28
+    blue_dragon = 29
+    mana_tree = 30
+    matango_flammie = 31
+    jehk = 32
+    hydra = 33
+    kettlekin = 34
+    shade_palace_chest = 35
+    luka_item1 = 36
+    luka_item2 = 37
+    sylphid_item1 = 38
+    sylphid_item2 = 39
+    whip_chest = 40
+    moogle_village_glove_orb_chest = 41
+    ice_castle_glove_orb_chest = 42
+    pandora_sword_orb_chest = 43
+    northtown_ruins_sword_orb_chest = 44
+    moogle_village_axe_orb_chest = 45
+    northtown_castle_axe_orb_chest = 46
+    northtown_ruins_spear_orb_chest = 47
+    pandora_spear_orb_chest = 48
+    santa_spear_orb_chest = 49
+    kilroy_whip_orb_chest = 50
+    northtown_castle_whip_orb_chest = 51
+    northtown_ruins_bow_orb_chest = 52
+    potos_chest = 53
+    pandora_chest1 = 54
+    pandora_chest2 = 55
+    pandora_chest3 = 56
+    pandora_chest4 = 57
+    magic_rope_chest = 58
+    northtown_castle_chest = 59
+    matango_inn_javelin_orb_chest = 60
+    watts = 61
+    undine_item1 = 62
+    undine_item2 = 63
+    salamando = 64
+    dryad_spells = 65
+    dryad_seed = 66
+    mara = 67
+    turtle_island = 68
+    dwarf_elder = 69
+    tropicallo_item1 = 70
+    tropicallo_item2 = 71
+    girl = 72
+    solar = 73
+    kilroy = 74
+    mantis_ant = 75
+    axe_beak = 76
+    snow_dragon = 77
+    dragon_worm = 78
+    doom_wall = 79
+    vampire = 80
+    mech_rider2 = 81
+    watermelon = 82
+    hexas = 83
+    wall_face = 84
+    metal_mantis = 85
+    jema_at_tasnica = 86
+    triple_tonpole = 87
+    sword_pedestal = 88
+    boy_starter_weapon = 268
+    girl_starter_weapon = 269
+    sprite_starter_weapon = 270
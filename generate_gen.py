@@ -5,34 +5,59 @@ import typing as t
 
 def generate_gen(f: t.TextIO) -> None:
     f.write("# This file is auto-generated! DO NOT MODIFY BY HAND!\n\n")
-    f.write("from enum import Enum, IntEnum\n")
+    f.write("import typing as t\n")
+    f.write("\n")
+    f.write("from BaseClasses import ItemClassification\n")
+    f.write("\n")
+    f.write("if t.TYPE_CHECKING:\n")
+    f.write("    from .gen_enums import ItemId as ItemId, LocationId as LocationId, WorkingDataKey as WorkingDataKey\n")
     f.write("\n")
     dump_dict(f, "item_name_to_id", get_item_mapping())
     dump_dict(f, "location_name_to_id", get_location_mapping())
     dump_dict(f, "item_name_groups", get_item_grouping(), type_hint="dict[str, set[str]]")
+    dump_reverse_lookup(f, "item_names_by_id", get_item_mapping())
+    dump_reverse_lookup(f, "location_names_by_id", get_location_mapping())
+    characters = ("boy", "girl", "sprite")
+    dump_key_mapping(f, "character_exists_keys", characters, "_EXISTS")
+    dump_key_mapping(f, "character_in_logic_keys", characters, "_IN_LOGIC")
+    dump_key_mapping(f, "character_class_keys", characters, "_CLASS")
+    dump_key_mapping(f, "character_starter_weapon_keys", characters, "_START_WEAPON_INDEX")
+    dump_dict(f, "spell_progression", get_spell_progression())
+    dump_item_id_set(f, "progression_items", get_progression_items())
+    dump_item_id_set(f, "useful_items", get_useful_items())
+    dump_item_id_set(f, "character_items", get_character_items())
+    dump_frozen_set(f, "progression_event_rewards", get_progression_event_rewards(), type_hint="str")
+    dump_dict(f, "spell_casters", get_spell_casters())
+    dump_dict(f, "compound_requirements", get_compound_requirements(), type_hint="dict[str, list[list[str]]]")
+    dump_item_classifications(f, "item_classifications")
+    dump_dict(f, "orb_element_keys", get_orb_element_keys())
+    dump_dict(f, "element_names", get_element_names(), type_hint="dict[int, str]")
     f.write("\n\n")
-    working_data_keys = get_working_data_keys()
-    dump_enum(f, "WorkingDataKey", working_data_keys)
+    f.write("def __getattr__(name: str) -> t.Any:\n")
+    f.write("    # enums are only built on first use, see gen_enums.py\n")
+    f.write('    if name in ("ItemId", "LocationId", "WorkingDataKey"):\n')
+    f.write("        from . import gen_enums\n")
+    f.write("\n")
+    f.write("        return getattr(gen_enums, name)\n")
+    f.write('    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")\n')
+
+
+def generate_gen_enums(f: t.TextIO) -> None:
+    f.write("# This file is auto-generated! DO NOT MODIFY BY HAND!\n\n")
+    f.write("from enum import Enum, IntEnum\n")
+    f.write("\n\n")
+    dump_enum(f, "WorkingDataKey", get_working_data_keys())
     f.write("\n\n")
     dump_enum(f, "ItemId", get_item_ids_enum_data(), "IntEnum")
     f.write("\n\n")
     dump_enum(f, "LocationId", get_location_ids_enum_data(), "IntEnum")
-    f.write("\n\n")
-    characters = ("boy", "girl", "sprite")
-    dump_enum_mapping(f, "character_exists_keys", "WorkingDataKey", characters, "_EXISTS")
-    dump_enum_mapping(f, "character_in_logic_keys", "WorkingDataKey", characters, "_IN_LOGIC")
-    dump_enum_mapping(f, "character_class_keys", "WorkingDataKey", characters, "_CLASS")
-    dump_enum_mapping(f, "character_starter_weapon_keys", "WorkingDataKey", characters, "_START_WEAPON_INDEX")
-    dump_dict(f, "spell_progression", get_spell_progression())
-    dump_frozen_set(f, "progression_items", get_progression_items(), type_hint="ItemId", raw=True)
-    dump_frozen_set(f, "useful_items", get_useful_items(), type_hint="ItemId", raw=True)
-    dump_frozen_set(f, "character_items", get_character_items(), type_hint="ItemId", raw=True)
-    dump_frozen_set(f, "progression_event_rewards", get_progression_event_rewards(), type_hint="str")
 
 
 def main() -> None:
     with open("gen.py", "w", encoding="utf-8") as f:
         generate_gen(f)
+    with open("gen_enums.py", "w", encoding="utf-8") as f:
+        generate_gen_enums(f)
 
 
 def dump_dict(f: t.TextIO, obj_name: str, obj: dict[t.Any, t.Any], type_hint: str = "", raw: bool = False) -> None:
@@ -56,9 +81,28 @@ def dump_enum(f: t.TextIO, enum_name: str, pairs: t.Iterable[tuple[str, t.Any]],
         f.write(f"    {k} = {v_str}\n")
 
 
-def dump_enum_mapping(f: t.TextIO, map_name: str, enum_name: str, items: t.Iterable[str], suffix: str) -> None:
-    dct = {item: f"{enum_name}.{item.upper()}{suffix}" for item in items}
-    dump_dict(f, map_name, dct, raw=True)
+def dump_key_mapping(f: t.TextIO, map_name: str, items: t.Iterable[str], suffix: str) -> None:
+    working_data_keys = dict(get_working_data_keys())
+    dct = {item: working_data_keys[f"{item.upper()}{suffix}"] for item in items}
+    dump_dict(f, map_name, dct)
+
+
+def dump_reverse_lookup(f: t.TextIO, obj_name: str, mapping: dict[str, int]) -> None:
+    """Writes a tuple that maps id -> name, with None for unused ids."""
+    names = {v: k for k, v in mapping.items()}
+    f.write(f"{obj_name}: tuple[str | None, ...] = (\n")
+    gap = 0
+    for n in range(0, max(names) + 1):
+        if n not in names:
+            gap += 1
+            continue
+        if gap == 1:
+            f.write("    None,\n")
+        elif gap:
+            f.write(f"    *(None,) * {gap},\n")
+        gap = 0
+        f.write(f"    {json.dumps(names[n])},\n")
+    f.write(")\n")
 
 
 def dump_frozen_set(
@@ -83,6 +127,30 @@ def pythonize(s: str) -> str:
     return s
 
 
+def dump_item_id_set(f: t.TextIO, set_name: str, enum_names: t.Iterable[str]) -> None:
+    """Writes a frozenset of plain item ids, so that importing it does not require ItemId."""
+    item_ids = dict(get_item_ids_enum_data())
+    f.write(f"{set_name}: frozenset[int] = frozenset(\n")
+    f.write("    (\n")
+    for name in enum_names:
+        f.write(f"        {item_ids[name]},  # {name}\n")
+    f.write("    )\n")
+    f.write(")\n")
+
+
+def dump_item_classifications(f: t.TextIO, obj_name: str) -> None:
+    """Writes a tuple that maps item id -> ItemClassification, so items don't have to be classified at runtime."""
+    progression = set(get_progression_items()) | set(get_character_items())  # NOTE: characters lock a weapon
+    useful = set(get_useful_items())
+    names = {v: k for k, v in get_item_ids_enum_data()}
+    f.write(f"{obj_name}: tuple[ItemClassification, ...] = (\n")
+    for n in range(0, max(names) + 1):
+        name = names.get(n, None)
+        classification = "progression" if name in progression else "useful" if name in useful else "filler"
+        f.write(f"    ItemClassification.{classification},  # {name or 'unused'}\n")
+    f.write(")\n")
+
+
 @functools.cache
 def get_item_mapping() -> dict[str, int]:
     from pysomr import OW
@@ -177,7 +245,7 @@ def get_progression_items() -> t.Iterable[str]:
         "sea_hare_tail",
         "flammie_drum",
     )
-    return [f"ItemId.{name}" for name in enum_names]
+    return enum_names
 
 
 def get_useful_items() -> t.Iterable[str]:
@@ -186,7 +254,7 @@ def get_useful_items() -> t.Iterable[str]:
         "midge_mallet",
         "moogle_belt",
     )
-    return [f"ItemId.{name}" for name in enum_names]
+    return enum_names
 
 
 def get_character_items() -> t.Iterable[str]:
@@ -196,7 +264,7 @@ def get_character_items() -> t.Iterable[str]:
         "girl",
         "sprite",
     )
-    return [f"ItemId.{name}" for name in enum_names]
+    return enum_names
 
 
 def get_progression_event_rewards() -> t.Iterable[str]:
@@ -209,5 +277,60 @@ def get_progression_event_rewards() -> t.Iterable[str]:
     )
 
 
+def get_spell_casters() -> dict[str, str]:
+    # TODO: get from pysomr, or move to and import from pysomr?
+    # NOTE: girlCaster and spriteCaster are missing from requirements in SoMR for most locations
+    return {
+        "undine spells": "spriteCaster",
+        "gnome spells": "spriteCaster",
+        "sylphid spells": "anyCaster",
+        "salamando spells": "anyCaster",
+        "lumina spells": "girlCaster",
+        "shade spells": "spriteCaster",
+        "luna spells": "spriteCaster",
+        "dryad spells": "spriteCaster",
+    }
+
+
+def get_compound_requirements() -> dict[str, list[list[str]]]:
+    """Returns requirements that are not items as list of alternatives, each being a list of required items."""
+    # TODO: get from pysomr, or move to and import from pysomr?
+    return {
+        "cuttingWeapon": [["axe"], ["sword"]],
+        "elinee": [["axe"], ["whip", "sword"]],
+        # FIXME: this should actually be `(axe and element) or flammie`, but SoMR does `(axe or flammie) and element`
+        "matango": [["axe"], ["flammie drum"]],
+        "no spells": [[]],  # irrelevant for AP
+    }
+
+
+def get_orb_element_keys() -> dict[str, str]:
+    """Returns working data keys for the element required to hit an orb, by orb name for the spoiler."""
+    # TODO: get from pysomr, or move to and import from pysomr?
+    orb_maps = {
+        "matango": 307,
+        "earth palace": 291,
+        "first fire palace": 348,
+        "second fire palace": 240,
+        "third fire palace": 345,
+        "moon palace": 35,
+        "upperland": 41,
+        "grand palace 1": 420,
+        "grand palace 2": 421,
+        "grand palace 3": 422,
+        "grand palace 4": 423,
+        "grand palace 5": 424,
+        "grand palace 6": 425,
+        "grand palace 7": 426,
+    }
+    return {name: f"orbElement{map_num}" for name, map_num in orb_maps.items()}
+
+
+def get_element_names() -> dict[int, str]:
+    # TODO: get from pysomr, or move to and import from pysomr?
+    names = ["Gnome", "Undine", "Salamando", "Lumina", "Sylphid", "Shade", "Luna", "Dryad"]
+    return {0x81 + n: name for n, name in enumerate(names)}
+
+
 if __name__ == "__main__":
     main()
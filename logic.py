@@ -0,0 +1,263 @@
+import functools
+import typing as t
+
+from BaseClasses import CollectionState, Location
+
+from .gen import (
+    character_items,
+    compound_requirements,
+    item_names_by_id,
+    progression_event_rewards,
+    progression_items,
+    spell_casters,
+)
+
+__all__ = (
+    "LogicTable",
+    "canonicalize_alternatives",
+    "encode_requirements",
+    "export_requirements",
+    "fingerprint_key",
+    "get_fingerprint",
+    "get_seed_count",
+    "known_requirements",
+    "make_mask_rule",
+    "make_rule",
+    "normalize_requirements",
+    "required_names",
+    "requirement_bits",
+    "seed_names",
+    "update_fingerprint",
+)
+
+required_names: tuple[str, ...] = tuple(
+    sorted(
+        (
+            *(t.cast(str, item_names_by_id[item_id]) for item_id in progression_items | character_items),
+            *progression_event_rewards,
+        )
+    )
+)
+"""Items and events that SoM rules can depend on"""
+derived_names: tuple[str, ...] = tuple(name for name, options in compound_requirements.items() if [] not in options)
+"""Compound requirements that are kept as derived state, see update_fingerprint"""
+known_requirements: frozenset[str] = frozenset((*required_names, *compound_requirements))
+"""All requirement names that SoMR may report for a location"""
+requirement_bits: dict[str, int] = {name: 1 << n for n, name in enumerate((*required_names, *derived_names))}
+"""requirement name -> bit in a fingerprint or requirement mask"""
+derived_masks: tuple[tuple[int, tuple[int, ...]], ...] = tuple(
+    (
+        requirement_bits[name],
+        tuple(sum(requirement_bits[req] for req in option) for option in compound_requirements[name]),
+    )
+    for name in derived_names
+)
+"""bit of derived requirement, and alternative masks that fulfill it"""
+derived_inputs: int = sum(
+    {requirement_bits[req] for name in derived_names for option in compound_requirements[name] for req in option}
+)
+"""bits that derived requirements depend on"""
+implied_by: dict[str, tuple[frozenset[str], ...]] = {
+    name: tuple(frozenset(option) for option in compound_requirements[name]) for name in derived_names
+}
+"""requirement -> alternatives that imply it, so it can be dropped if any of them is also required"""
+seed_names: tuple[str, ...] = tuple(name for name in required_names if name.endswith(" seed"))
+fingerprint_key = "_som_fingerprint"
+"""key in CollectionState.prog_items that holds the fingerprint, see update_fingerprint"""
+seed_count_key = "_som_seeds"
+"""key in CollectionState.prog_items that holds the number of collected mana seeds"""
+max_memoized_fingerprints = 4096
+
+
+def normalize_requirements(requirements: t.Iterable[str]) -> tuple[str, ...]:
+    """
+    Converts SoMR requirements of a location to canonical requirements for AP, using the static tables from gen.py.
+    Drops irrelevant requirements, adds caster requirements that are missing in SoMR and drops requirements that are
+    implied by other requirements. The result is sorted, so equal requirements result in equal tuples.
+    """
+    assert not isinstance(requirements, str), "requirements must be a collection of strings, not string"
+    # convert SoMR.StrList to a hashable tuple, so the result can be cached
+    return _normalize_requirements(tuple(requirements))
+
+
+@functools.cache
+def _normalize_requirements(requirements: tuple[str, ...]) -> tuple[str, ...]:
+    # validate what we get from pysomr against the tables
+    unknown = [req for req in requirements if req not in known_requirements]
+    assert not unknown, f"Unknown SoMR requirements {unknown}, please update generate_gen"
+
+    # a compound requirement that has an empty alternative is always fulfilled
+    normalized = set(req for req in requirements if [] not in compound_requirements.get(req, ()))
+    casters = set(spell_casters[req] for req in normalized if req in spell_casters)
+    normalized.update(caster for caster in casters if caster != "anyCaster")
+    if "anyCaster" in casters and not normalized.intersection(("anyCaster", "girlCaster", "spriteCaster")):
+        normalized.add("anyCaster")
+    # subsumption, e.g. drop cuttingWeapon if axe is required
+    for name, alternatives in implied_by.items():
+        if name in normalized and any(alternative <= normalized for alternative in alternatives):
+            normalized.remove(name)
+    return tuple(sorted(normalized))
+
+
+def get_fingerprint(state: CollectionState, player: int) -> int:
+    """
+    Returns a bitmask of the requirements that are fulfilled by state.
+    Only changes when an item that may be required by SoM logic is collected or removed.
+    """
+    return state.prog_items[player][fingerprint_key]
+
+
+def get_seed_count(state: CollectionState, player: int) -> int:
+    """Returns the number of mana seeds in state, same as has_from_list(seed_names)."""
+    return state.prog_items[player][seed_count_key]
+
+
+def update_fingerprint(state: CollectionState, player: int, name: str) -> None:
+    """
+    Updates the fingerprint and derived state after name was collected or removed.
+    Call from World.collect and World.remove.
+    """
+    bit = requirement_bits.get(name, 0)
+    if not bit:
+        return
+    prog_items = state.prog_items[player]
+    fingerprint = prog_items[fingerprint_key]
+    if prog_items[name] > 0:
+        fingerprint |= bit
+    else:
+        fingerprint &= ~bit
+    if bit & derived_inputs:
+        for derived_bit, alternatives in derived_masks:
+            if any((fingerprint & alt) == alt for alt in alternatives):
+                fingerprint |= derived_bit
+            else:
+                fingerprint &= ~derived_bit
+    prog_items[fingerprint_key] = fingerprint
+    if name in seed_names:
+        prog_items[seed_count_key] = sum(prog_items[seed] for seed in seed_names)
+
+
+def export_requirements(locations: t.Iterable[tuple[int, t.Iterable[str]]]) -> dict[str, t.Any]:
+    """
+    Returns normalized requirements per location as interned tables, e.g. for slot data:
+    names: requirement names; sets: requirement sets as indices into names; locations: [location ID, set index] pairs;
+    derived: [name index, alternatives as indices into names] pairs for the derived requirements that are used.
+    """
+    names: dict[str, int] = {}
+    sets: dict[tuple[int, ...], int] = {}
+    pairs: list[list[int]] = []
+    for location_id, requirements in locations:
+        key = tuple(sorted(names.setdefault(name, len(names)) for name in requirements))
+        pairs.append([location_id, sets.setdefault(key, len(sets))])
+    derived = [
+        [names[name], [[names.setdefault(req, len(names)) for req in option] for option in compound_requirements[name]]]
+        for name in derived_names
+        if name in names
+    ]
+    return {"names": list(names), "sets": [list(key) for key in sets], "locations": pairs, "derived": derived}
+
+
+def encode_requirements(requirements: t.Iterable[str]) -> int:
+    """Returns normalized requirements as a mask that has to be fully contained in the fingerprint."""
+    return sum({requirement_bits[req] for req in requirements})
+
+
+def canonicalize_alternatives(masks: t.Iterable[int]) -> tuple[int, ...]:
+    """Drops alternatives that require a superset of another alternative. The result is sorted."""
+    unique = set(masks)
+    return tuple(
+        sorted(mask for mask in unique if not any(other != mask and (other & mask) == other for other in unique))
+    )
+
+
+def make_rule(requirements: t.Iterable[str], player: int) -> t.Callable[[CollectionState], bool] | None:
+    """Returns an O(1) rule for normalized requirements, or None if there are no requirements."""
+    return make_mask_rule((encode_requirements(requirements),), player)
+
+
+def make_mask_rule(masks: tuple[int, ...], player: int) -> t.Callable[[CollectionState], bool] | None:
+    """Returns a rule that is fulfilled if any of the masks is fully contained in the fingerprint."""
+    if not masks or 0 in masks:
+        return None
+
+    if len(masks) == 1:
+        mask = masks[0]
+
+        def rule(state: CollectionState) -> bool:
+            return (state.prog_items[player][fingerprint_key] & mask) == mask
+
+        return rule
+
+    def any_rule(state: CollectionState) -> bool:
+        fingerprint = state.prog_items[player][fingerprint_key]
+        return any((fingerprint & mask) == mask for mask in masks)
+
+    return any_rule
+
+
+class LogicTable:
+    """
+    Requirements of all locations of a player, encoded as bitmasks over the required items, events and derived state.
+    This allows checking all locations against a state in one pass instead of calling each access rule.
+    """
+
+    player: int
+    entries: list[tuple[Location, tuple[int, ...]]]
+    """location and its alternatives; the location is reachable if all bits of any of them are set in the fingerprint"""
+    rules: dict[tuple[int, ...], t.Callable[[CollectionState], bool] | None]
+    """canonical alternatives -> rule, so that locations with the same requirements share a rule"""
+    _reachable: dict[int, tuple[Location, ...]]
+    """fingerprint -> reachable locations"""
+
+    def __init__(self, player: int) -> None:
+        self.player = player
+        self.entries = []
+        self.rules = {}
+        self._reachable = {}
+
+    def get_rule(self, requirements: t.Iterable[str]) -> t.Callable[[CollectionState], bool] | None:
+        """Returns the shared rule for (normalized) requirements."""
+        return self.get_any_rule((requirements,))
+
+    def get_any_rule(self, alternatives: t.Iterable[t.Iterable[str]]) -> t.Callable[[CollectionState], bool] | None:
+        """Returns the shared rule that is fulfilled if any of the (normalized) requirements are fulfilled."""
+        masks = canonicalize_alternatives(map(encode_requirements, alternatives))
+        try:
+            return self.rules[masks]
+        except KeyError:
+            rule = self.rules[masks] = make_mask_rule(masks, self.player)
+            return rule
+
+    def add(self, location: Location, requirements: t.Iterable[str]) -> None:
+        self.add_any(location, (requirements,))
+
+    def add_any(self, location: Location, alternatives: t.Iterable[t.Iterable[str]]) -> None:
+        self.entries.append((location, canonicalize_alternatives(map(encode_requirements, alternatives))))
+        self._reachable.clear()
+
+    def get_candidate_locations(self, name: str) -> list[Location]:
+        """
+        Returns locations that can hold name without locking themselves, i.e. that do not always require it.
+        Only direct requirements are considered, e.g. a location that requires spriteCaster is returned for sprite.
+        """
+        bit = requirement_bits.get(name, 0)
+        return [
+            location
+            for location, alternatives in self.entries
+            if not bit or not all(alt & bit for alt in alternatives) or not alternatives
+        ]
+
+    def get_reachable(self, state: CollectionState) -> tuple[Location, ...]:
+        """Returns all locations that are reachable in state. The result is memoized by fingerprint, hence a tuple."""
+        have = get_fingerprint(state, self.player)
+        try:
+            return self._reachable[have]
+        except KeyError:
+            pass
+        if len(self._reachable) >= max_memoized_fingerprints:
+            self._reachable.clear()
+        reachable = tuple(
+            location for location, alternatives in self.entries if any((have & alt) == alt for alt in alternatives)
+        )
+        self._reachable[have] = reachable
+        return reachable
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import logging
+import os
+import typing as t
+from dataclasses import asdict, dataclass
+from tempfile import NamedTemporaryFile
+
+from .gen import (
+    character_class_keys,
+    character_exists_keys,
+    character_in_logic_keys,
+    character_starter_weapon_keys,
+    item_name_to_id,
+    orb_element_keys,
+)
+
+if t.TYPE_CHECKING:
+    from pysomr import OW
+
+__all__ = (
+    "LogicData",
+    "build_logic_data",
+    "get_cache_key",
+    "load_cached",
+    "store_cached",
+)
+
+cache_version = 1
+"""bump this when LogicData or what goes into it changes"""
+uncached_settings = frozenset(("loggingDirectory", "spoilerLog", "apSeed", "apConnectName"))
+"""SoMR settings that only affect output, not logic"""
+
+
+@dataclass
+class LogicData:
+    """Everything the logic stages read from SoMR, so that those do not need an OW instance."""
+
+    starting_characters: list[str]
+    findable_characters: list[str]
+    char_classes: dict[str, str]
+    starter_weapons: dict[str, int]
+    """character -> item id of the weapon"""
+    locations: list[tuple[int, tuple[str, ...]]]
+    """location id and SoMR requirements"""
+    items: list[int]
+    """item ids of the item pool"""
+    mana_seeds_required: int
+    orb_elements: dict[str, int]
+    """orb name -> element id"""
+
+    @classmethod
+    def from_ow(cls, ow: "OW") -> "LogicData":
+        working_data = ow.context.working_data
+        data = cls([], [], {}, {}, [], [], working_data.get_int("manaSeedsRequired"), {})
+        for char in ("boy", "girl", "sprite"):
+            exists = working_data.get_bool(character_exists_keys[char])
+            if exists:
+                find = working_data.get_bool(character_in_logic_keys[char])
+                if find:
+                    data.findable_characters.append(char)
+                else:
+                    data.starting_characters.append(char)
+                weapon_index = working_data.get_int(character_starter_weapon_keys[char])
+                data.starter_weapons[char] = item_name_to_id["glove"] + weapon_index
+            data.char_classes[char] = working_data[character_class_keys[char]]
+        # convert SoMR.StrList to tuple[str, ...]
+        data.locations = [(location.id, tuple(location.requirements)) for location in ow.generator.get_locations()]
+        data.items = [item.id for item in ow.generator.get_items()]
+        data.orb_elements = {name: working_data.get_int(key) for name, key in orb_element_keys.items()}
+        return data
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, s: str) -> "LogicData":
+        dct = json.loads(s)
+        dct["locations"] = [(location_id, tuple(requirements)) for location_id, requirements in dct["locations"]]
+        return cls(**dct)
+
+
+def build_logic_data(rom_file: str, somr_seed: str, somr_settings: dict[str, str]) -> LogicData:
+    """Builds SoMR and returns its LogicData. Used in worker processes, so the OW never leaves the worker."""
+    from pysomr import OW
+
+    return LogicData.from_ow(OW(rom_file, somr_seed, somr_settings))
+
+
+def get_cache_key(pysomr_version: str, somr_seed: str, somr_settings: t.Mapping[str, str]) -> str:
+    """Returns a key that identifies the logic output of SoMR."""
+    logic_settings = {k: v for k, v in somr_settings.items() if k not in uncached_settings}
+    key_data = json.dumps([cache_version, pysomr_version, somr_seed, logic_settings], sort_keys=True)
+    return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+
+def _get_cache_file(key: str) -> str:
+    from Utils import cache_path
+
+    return cache_path("som", "logic", f"{key}.json")
+
+
+def load_cached(key: str) -> LogicData | None:
+    try:
+        with open(_get_cache_file(key), encoding="utf-8") as f:
+            return LogicData.from_json(f.read())
+    except FileNotFoundError:
+        return None
+    except (ValueError, TypeError, KeyError) as e:
+        logging.warning(f"Ignoring invalid SoM logic cache entry {key}: {e}")
+        return None
+
+
+def store_cached(key: str, data: LogicData) -> None:
+    cache_file = _get_cache_file(key)
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    # write to a temp file and rename, so that concurrent generators never see a partial file
+    with NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(cache_file), delete=False) as f:
+        f.write(data.to_json())
+    os.replace(f.name, cache_file)
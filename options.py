@@ -1,12 +1,14 @@
+import functools
 import typing as t
 from abc import abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 from Options import PerGameCommonOptions, Choice, Range, Toggle
 
 __all__ = (
     "SoMOptions",
     "SoMROptionProto",
+    "get_somr_settings",
     "Goal",
     "Logic",
     "FlammieDrum",
@@ -36,6 +38,10 @@ class SoMRToggle(Toggle):
     def somr_value(self) -> str:
         return self.somr_values[self.value]
 
+    @classmethod
+    def get_somr_encoder(cls) -> t.Callable[[int], str]:
+        return cls.somr_values.__getitem__
+
 
 class SoMRDefaultOnToggle(SoMRToggle):
     default = 1
@@ -53,6 +59,10 @@ class SoMRChoice(Choice):
     def somr_value(self) -> str:
         return self.somr_values[self.value]
 
+    @classmethod
+    def get_somr_encoder(cls) -> t.Callable[[int], str]:
+        return cls.somr_values.__getitem__
+
 
 class SoMRRange(Range):
     somr_setting: t.ClassVar[str]
@@ -61,13 +71,25 @@ class SoMRRange(Range):
     def somr_value(self) -> str:
         return str(self.value)
 
+    @classmethod
+    def get_somr_encoder(cls) -> t.Callable[[int], str]:
+        return str
+
 
 class SoMRDecimalRange(Range):
     somr_setting: t.ClassVar[str]
 
     @property
     def somr_value(self) -> str:
-        return "%.2f" % (self.value / 100)
+        return self.encode_decimal(self.value)
+
+    @staticmethod
+    def encode_decimal(value: int) -> str:
+        return "%.2f" % (value / 100)
+
+    @classmethod
+    def get_somr_encoder(cls) -> t.Callable[[int], str]:
+        return cls.encode_decimal
 
 
 # option types
@@ -454,3 +476,27 @@ class SoMOptions(PerGameCommonOptions):
     randomize_weapons: RandomizeWeapons
     randomize_shops: RandomizeShops
     randomize_music: RandomizeMusic
+
+
+@functools.cache
+def get_somr_option_table(
+    options_dataclass: type[PerGameCommonOptions],
+) -> tuple[tuple[str, str, t.Callable[[int], str]], ...]:
+    """Returns (attribute name, SoMR setting, value encoder) for all SoMR options of options_dataclass."""
+    common_fields = set(field.name for field in fields(PerGameCommonOptions))
+    type_hints = t.get_type_hints(options_dataclass)
+    table: list[tuple[str, str, t.Callable[[int], str]]] = []
+    for field in fields(options_dataclass):
+        option_type = type_hints[field.name]
+        if issubclass(option_type, (SoMRToggle, SoMRChoice, SoMRRange, SoMRDecimalRange)):
+            table.append((field.name, option_type.somr_setting, option_type.get_somr_encoder()))
+        else:
+            assert field.name in common_fields, f"{field.name} neither common nor SoMR"
+    return tuple(table)
+
+
+def get_somr_settings(options: PerGameCommonOptions) -> dict[str, str]:
+    """Returns SoMR settings for options."""
+    return {
+        setting: encode(getattr(options, name).value) for name, setting, encode in get_somr_option_table(type(options))
+    }
@@ -0,0 +1,127 @@
+"""
+Applies many .apsom patches at once, reading the base ROM only once.
+Run from the Archipelago directory: python -m worlds.som.patcher --help
+"""
+
+import hashlib
+import os
+import sys
+import time
+import typing as t
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from . import SoMDeltaPatch, SoMWorld
+
+__all__ = (
+    "find_patches",
+    "get_patch_hash",
+    "is_up_to_date",
+    "main",
+    "patch_all",
+)
+
+hash_suffix = ".sha256"
+"""suffix of the file next to an output that holds the hash of the patch it was created from"""
+
+
+class PreloadedSoMDeltaPatch(SoMDeltaPatch):
+    """SoMDeltaPatch that uses base ROM data passed in by the parent process instead of reading the ROM file."""
+
+    preloaded_source_data: t.ClassVar[bytes]
+
+    @classmethod
+    def get_source_data(cls) -> bytes:
+        return cls.preloaded_source_data
+
+
+def _init_worker(source_data: bytes) -> None:
+    PreloadedSoMDeltaPatch.preloaded_source_data = source_data
+
+
+def _patch(patch_file: str, out_file: str, patch_hash: str) -> float:
+    start = time.perf_counter()
+    PreloadedSoMDeltaPatch(patch_file).patch(out_file)
+    with open(out_file + hash_suffix, "w", encoding="utf-8") as f:
+        f.write(patch_hash)
+    return time.perf_counter() - start
+
+
+def get_patch_hash(patch_file: Path) -> str:
+    with open(patch_file, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def is_up_to_date(out_file: Path, patch_hash: str) -> bool:
+    """Returns True if out_file exists and was created from a patch with patch_hash."""
+    try:
+        with open(str(out_file) + hash_suffix, encoding="utf-8") as f:
+            return out_file.exists() and f.read() == patch_hash
+    except FileNotFoundError:
+        return False
+
+
+def find_patches(source: Path, extract_dir: Path) -> list[Path]:
+    """Returns all .apsom files in a directory or multiworld zip. Files in a zip are extracted to extract_dir."""
+    suffix = SoMDeltaPatch.patch_file_ending
+    if source.is_dir():
+        return sorted(path for path in source.iterdir() if path.suffix == suffix)
+    with zipfile.ZipFile(source) as zf:
+        names = sorted(name for name in zf.namelist() if name.endswith(suffix))
+        return [Path(zf.extract(name, extract_dir)) for name in names]
+
+
+def patch_all(
+    patches: t.Sequence[Path], out_dir: Path, workers: int = 0, force: bool = False
+) -> t.Iterator[tuple[Path, float | None]]:
+    """
+    Applies patches in a process pool and yields (patch, seconds) in input order, seconds is None if it was skipped.
+    The base ROM is read once and passed to the workers.
+    """
+    jobs: list[tuple[Path, str, str]] = []
+    skipped: set[Path] = set()
+    for patch in patches:
+        out_file = out_dir / (patch.stem + SoMDeltaPatch.result_file_ending)
+        patch_hash = get_patch_hash(patch)
+        if not force and is_up_to_date(out_file, patch_hash):
+            skipped.add(patch)
+        else:
+            jobs.append((patch, str(out_file), patch_hash))
+    if not jobs:
+        yield from ((patch, None) for patch in patches)
+        return
+
+    source_data = SoMWorld.settings.rom_file.read()
+    max_workers = min(len(jobs), workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(source_data,)) as pool:
+        futures = {patch: pool.submit(_patch, str(patch), out_file, patch_hash) for patch, out_file, patch_hash in jobs}
+        for patch in patches:
+            yield patch, None if patch in skipped else futures[patch].result()
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apply all .apsom patches in a directory or multiworld zip.")
+    parser.add_argument("source", help="directory or zip that contains .apsom files")
+    parser.add_argument("-o", "--out", default=None, help="output directory, defaults to source directory")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="number of worker processes, 0 for CPU count")
+    parser.add_argument("-f", "--force", action="store_true", help="patch even if the output is up to date")
+    args = parser.parse_args(argv)
+
+    source = Path(args.source)
+    out_dir = Path(args.out) if args.out else (source if source.is_dir() else source.parent)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    with TemporaryDirectory(prefix="som_patcher_") as extract_dir:
+        patches = find_patches(source, Path(extract_dir))
+        for patch, seconds in patch_all(patches, out_dir, args.workers, args.force):
+            print(f"{patch.name}: {'up to date' if seconds is None else f'{seconds:.2f}s'}")
+    print(f"{len(patches)} patches in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+import os
+import threading
+import typing as t
+from contextlib import contextmanager
+
+__all__ = (
+    "MemoryBudget",
+    "estimate_ow_memory",
+    "get_memory_budget",
+    "get_physical_memory",
+)
+
+ow_base_memory = 64 * 1024 * 1024
+"""estimated memory of a SoMR instance without ROM buffers"""
+ow_rom_copies = 16
+"""estimated number of ROM sized buffers of a SoMR instance, including ow.run"""
+default_budget_fraction = 0.5
+"""fraction of physical memory to use if no budget is configured"""
+
+_budget: "MemoryBudget | None" = None
+_budget_lock = threading.Lock()
+
+
+class MemoryBudget:
+    """
+    Limits the estimated memory of SoMR work running at the same time in this process.
+    Work that does not fit waits until enough memory is released. Work that is bigger than the budget runs alone.
+    """
+
+    budget: int
+    """max bytes, 0 for unlimited"""
+    used: int
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def _clamp(self, size: int) -> int:
+        return min(size, self.budget) if self.budget else 0
+
+    def acquire(self, size: int) -> None:
+        """Waits until size bytes are available and reserves them."""
+        size = self._clamp(size)
+        with self._condition:
+            self._condition.wait_for(lambda: self.used + size <= self.budget or not self.budget)
+            self.used += size
+
+    def release(self, size: int) -> None:
+        """Releases size bytes that were reserved by acquire."""
+        size = self._clamp(size)
+        with self._condition:
+            self.used -= size
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, size: int) -> t.Iterator[None]:
+        self.acquire(size)
+        try:
+            yield
+        finally:
+            self.release(size)
+
+
+def get_physical_memory() -> int | None:
+    """Returns the physical memory in bytes, or None if it can not be determined."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def get_memory_budget(budget_mib: int) -> MemoryBudget:
+    """Returns the process-wide MemoryBudget. The budget is taken from the first call, 0 uses physical memory."""
+    global _budget
+
+    with _budget_lock:
+        if _budget is None:
+            if budget_mib:
+                budget = budget_mib * 1024 * 1024
+            else:
+                physical_memory = get_physical_memory()
+                budget = int(physical_memory * default_budget_fraction) if physical_memory else 0
+            _budget = MemoryBudget(budget)
+        return _budget
+
+
+def estimate_ow_memory(rom_file: str) -> int:
+    """Returns the estimated peak memory of a SoMR instance, including ow.run, in bytes."""
+    try:
+        rom_size = os.path.getsize(rom_file)
+    except OSError:
+        rom_size = 2 * 1024 * 1024
+    return ow_base_memory + rom_size * ow_rom_copies
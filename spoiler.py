@@ -0,0 +1,32 @@
+import typing as t
+
+__all__ = ("copy_spoiler",)
+
+chunk_size = 64 * 1024
+
+
+def copy_spoiler(source: t.TextIO, dest: t.TextIO, sections: t.Collection[str] = ()) -> None:
+    """
+    Streams the SoMR spoiler from source to dest without reading it into memory as a whole.
+    If sections is not empty, only blocks whose first line starts with any of sections (case-insensitive) are copied.
+    Blocks are separated by empty lines.
+    """
+    if not sections:
+        while chunk := source.read(chunk_size):
+            dest.write(chunk)
+        return
+
+    prefixes = tuple(section.strip().lower() for section in sections)
+    copy_block = False
+    start_of_block = True
+    for line in source:
+        if not line.strip():
+            if copy_block:
+                dest.write(line)
+            start_of_block = True
+            continue
+        if start_of_block:
+            copy_block = line.lstrip().lower().startswith(prefixes)
+            start_of_block = False
+        if copy_block:
+            dest.write(line)
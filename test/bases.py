@@ -0,0 +1,55 @@
+import typing as t
+
+from test.bases import WorldTestBase
+
+if t.TYPE_CHECKING:
+    from BaseClasses import MultiWorld
+
+__all__ = (
+    "SoMTestBase",
+    "create_multiworld",
+)
+
+
+def create_multiworld(seed: int, player_options: t.Sequence[dict[str, t.Any]]) -> "MultiWorld":
+    """Returns a multiworld with a SoM slot per entry of player_options, with worlds created but nothing generated."""
+    from argparse import Namespace
+
+    from BaseClasses import CollectionState, MultiWorld
+
+    from .. import SoMWorld
+
+    players = range(1, len(player_options) + 1)
+    multiworld = MultiWorld(len(player_options))
+    for player in players:
+        multiworld.game[player] = SoMWorld.game
+    multiworld.player_name = {player: f"Tester{player}" for player in players}
+    multiworld.set_seed(seed)
+    multiworld.seed_name = str(seed)
+    args = Namespace()
+    for name, option_type in SoMWorld.options_dataclass.type_hints.items():
+        values = {
+            player: option_type.from_any(options.get(name, option_type.default))
+            for player, options in zip(players, player_options)
+        }
+        setattr(args, name, values)
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)  # as in Archipelago's test setup, e.g. for push_precollected
+    return multiworld
+
+
+class SoMTestBase(WorldTestBase):
+    """Generates a solo SoM seed with the offline stand-in for pysomr, without the default tests of WorldTestBase."""
+
+    game = "Secret of Mana"
+    run_default_tests = False
+
+    def setUp(self) -> None:
+        from .. import SoMWorld
+        from .fake_pysomr import use_fake_pysomr
+
+        use_fake_pysomr(self)
+        for name, value in {"ow_build_mode": "serial", "logic_cache": False}.items():
+            self.addCleanup(setattr, SoMWorld.settings, name, getattr(SoMWorld.settings, name))
+            setattr(SoMWorld.settings, name, value)
+        super().setUp()
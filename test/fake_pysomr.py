@@ -0,0 +1,202 @@
+"""
+Offline stand-in for pysomr, so tests and the fuzzer run without pysomr and the ROM.
+"""
+
+import json
+import os
+import random
+import sys
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+from unittest import TestCase
+
+from ..gen import (
+    character_class_keys,
+    character_exists_keys,
+    character_in_logic_keys,
+    character_starter_weapon_keys,
+    item_name_to_id,
+    item_names_by_id,
+    location_names_by_id,
+    orb_element_keys,
+    progression_items,
+)
+from ..logic_data import uncached_settings
+
+__all__ = (
+    "FakeOW",
+    "install_fake_pysomr",
+    "use_fake_pysomr",
+)
+
+
+class FakeWorkingData:
+    data: dict[str, str]
+
+    def __init__(self, data: dict[str, str]) -> None:
+        self.data = data
+
+    def __getitem__(self, key: str) -> str:
+        return self.data[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self.data[key] = value
+
+    def get_int(self, key: str) -> int:
+        return int(self.data[key])
+
+    def get_bool(self, key: str) -> bool:
+        return self.data[key] == "yes"
+
+
+@dataclass
+class FakeLocation:
+    id: int
+    requirements: tuple[str, ...]
+
+
+@dataclass
+class FakeItem:
+    id: int
+
+
+class FakeGenerator:
+    locations: list[FakeLocation]
+    items: list[FakeItem]
+
+    def __init__(self, locations: list[FakeLocation], items: list[FakeItem]) -> None:
+        self.locations = locations
+        self.items = items
+
+    def get_locations(self) -> list[FakeLocation]:
+        return self.locations
+
+    def get_items(self) -> list[FakeItem]:
+        return self.items
+
+
+class FakeContext:
+    working_data: FakeWorkingData
+
+    def __init__(self, working_data: FakeWorkingData) -> None:
+        self.working_data = working_data
+
+
+class FakeOW:
+    """
+    Implements the parts of pysomr.OW that the world uses, with plausible random data derived from seed and the
+    settings that affect logic. The output is not a playable ROM.
+    """
+
+    fail_seed_setting: t.ClassVar[str] = "fakeFailSeed"
+    """setting to simulate SoMR running out of memory for the seed that is its value"""
+    crash_seed_setting: t.ClassVar[str] = "fakeCrashSeed"
+    """setting to simulate SoMR crashing the process for the seed that is its value, only use in worker processes"""
+    reject_setting: t.ClassVar[str] = "fakeReject"
+    """setting to simulate SoMR rejecting the settings"""
+    forced_item: t.ClassVar[tuple[str, int] | None] = None
+    """(item name, location id) to make every other location require the item, so it can only go to that location"""
+
+    def __init__(self, rom_file: str, seed: str, settings: dict[str, str]) -> None:
+        if settings.get(self.fail_seed_setting) == seed:
+            raise MemoryError(f"fake pysomr: out of memory for seed {seed}")
+        if settings.get(self.crash_seed_setting) == seed:
+            os._exit(1)
+        if self.reject_setting in settings:
+            raise ValueError("fake pysomr: invalid settings")
+        logic_settings = {k: v for k, v in settings.items() if k not in uncached_settings}
+        rng = random.Random(json.dumps([seed, logic_settings], sort_keys=True))
+        data: dict[str, str] = {"manaSeedsRequired": settings.get("opNumSeeds", "8")}
+        start_char = settings.get("opStartChar", "boy")
+        others = [char for char in ("boy", "girl", "sprite") if char != start_char]
+        rng.shuffle(others)
+        mode = settings.get("opCharacters", "findbothL1")
+        starting = [start_char]
+        findable: list[str] = []
+        if mode == "startboth":
+            starting += others
+        elif mode in ("start1find1", "start1only"):
+            starting += others[:1]
+            findable = others[1:] if mode == "start1find1" else []
+        elif mode in ("findbothL1", "findbothCL"):
+            findable = others
+        elif mode in ("find1L1", "find1CL"):
+            findable = others[:1]
+        roles = {"boy": "opBoyRole", "girl": "opGirlRole", "sprite": "opSpriteRole"}
+        for char in ("boy", "girl", "sprite"):
+            data[character_exists_keys[char]] = "yes" if char in starting or char in findable else "no"
+            data[character_in_logic_keys[char]] = "yes" if char in findable else "no"
+            role = settings.get(roles[char], f"OG{char}")
+            data[character_class_keys[char]] = role if role.startswith("OG") else f"OG{rng.choice(list(roles))}"
+            weapon = settings.get("opStartWeapon", "0") if char == start_char else str(rng.randrange(8))
+            data[character_starter_weapon_keys[char]] = weapon
+        for key in orb_element_keys.values():
+            data[key] = str(rng.randrange(0x81, 0x89))
+        self.context = FakeContext(FakeWorkingData(data))
+
+        drum_in_pool = settings.get("opFlammieDrumInLogic", "no") == "yes"
+        pool = [
+            item_id
+            for item_id in sorted(progression_items)
+            if drum_in_pool or item_id != item_name_to_id["flammie drum"]
+        ]
+        pool += [item_name_to_id[char] for char in findable]
+        # spells are left out, since they would require casters that may not exist
+        pool_names = [t.cast(str, item_names_by_id[item_id]) for item_id in pool]
+        requirement_names = [name for name in pool_names if not name.endswith(" spells")]
+        requirement_names += ["cuttingWeapon", "elinee", "matango"]
+        locations = []
+        for location_id, name in enumerate(location_names_by_id):
+            if name is None or name.endswith(" starter weapon"):
+                continue
+            requirements: tuple[str, ...] = ()
+            if rng.random() < 0.5:
+                requirements = tuple(rng.sample(requirement_names, rng.randint(1, 2)))
+            if self.forced_item:
+                forced_name, forced_location_id = self.forced_item
+                if location_id == forced_location_id:
+                    requirements = ()
+                elif forced_name not in requirements:
+                    requirements += (forced_name,)
+            locations.append(FakeLocation(location_id, requirements))
+        gold = [item_name_to_id[f"GP {n}"] for n in range(17)]
+        pool += [rng.choice(gold) for _ in range(len(locations) - len(pool))]
+        self.generator = FakeGenerator(locations, [FakeItem(item_id) for item_id in pool[: len(locations)]])
+
+        logging_directory = Path(settings.get("loggingDirectory", "."))
+        with open(logging_directory / f"log_{seed}.txt", "w") as f:
+            f.write(f"fake pysomr: seed {seed}, {len(locations)} locations\n")
+        if settings.get("spoilerLog") == "yes":
+            with open(logging_directory / f"log_{seed}_SPOILER.txt", "w") as f:
+                f.write(f"Fake spoiler for {seed}\n")
+
+    def run(self, out_file: str) -> None:
+        with open(out_file, "wb") as f:
+            f.write(json.dumps(self.context.working_data.data, sort_keys=True).encode("utf-8"))
+
+
+def install_fake_pysomr() -> None:
+    """
+    Makes `from pysomr import OW` return FakeOW and replaces the pysomr version check of the world with this function,
+    so worker processes that run it as initializer use FakeOW as well.
+    """
+    from types import ModuleType
+
+    module = ModuleType("pysomr")
+    module.OW = FakeOW  # type: ignore[attr-defined]
+    sys.modules["pysomr"] = module
+    world_module = sys.modules[__name__.rsplit(".", 2)[0]]
+    world_module.require_pysomr = install_fake_pysomr  # type: ignore[attr-defined]
+
+
+def use_fake_pysomr(test: TestCase) -> None:
+    """Installs the fake pysomr for test and restores the previous pysomr and version check after it."""
+    world_module = sys.modules[__name__.rsplit(".", 2)[0]]
+    test.addCleanup(setattr, world_module, "require_pysomr", world_module.require_pysomr)
+    old_pysomr = sys.modules.get("pysomr")
+    if old_pysomr is None:
+        test.addCleanup(sys.modules.pop, "pysomr", None)
+    else:
+        test.addCleanup(sys.modules.__setitem__, "pysomr", old_pysomr)
+    install_fake_pysomr()
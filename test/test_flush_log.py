@@ -0,0 +1,53 @@
+import logging
+import typing as t
+from unittest import TestCase
+
+if t.TYPE_CHECKING:
+    from .. import SoMWorld
+
+
+class TestFlushLog(TestCase):
+    """Checks how the SoMR log is forwarded to logging."""
+
+    lines = [f"line {n:02}\n" for n in range(20)]  # 8 characters each
+
+    def create_world(self) -> "SoMWorld":
+        from io import StringIO
+
+        from .. import SoMWorld
+        from .bases import create_multiworld
+
+        world = create_multiworld(0, [{}]).worlds[1]
+        assert isinstance(world, SoMWorld)
+        world.somr_log_file = StringIO("".join(self.lines))
+        return world
+
+    def test_disabled_level_is_not_read(self) -> None:
+        world = self.create_world()
+        with self.assertLogs(level="INFO") as logs:
+            world.flush_log()
+            logging.info("flushed")  # assertLogs requires at least one record
+        self.assertEqual(logs.output, ["INFO:root:flushed"])
+        # nothing was read, so the error contains the whole log
+        with self.assertLogs(level="INFO") as logs:
+            world.flush_log(error=True)
+        self.assertEqual([record.levelno for record in logs.records], [logging.ERROR])
+        self.assertTrue(logs.records[0].getMessage().endswith("".join(self.lines)))
+
+    def test_debug_is_chunked_and_limited(self) -> None:
+        from .. import SoMWorld
+
+        for name, value in {"somr_log_chunk_size": 20, "somr_log_limit": 50}.items():
+            self.addCleanup(setattr, SoMWorld, name, getattr(SoMWorld, name))
+            setattr(SoMWorld, name, value)
+        world = self.create_world()
+        with self.assertLogs(level="DEBUG") as logs:
+            world.flush_log()
+            world.flush_log()  # the limit was reached, so this does not log anything
+        self.assertTrue(all(record.levelno == logging.DEBUG for record in logs.records))
+        messages = [record.getMessage() for record in logs.records]
+        # a chunk is at least 20 characters, i.e. 3 lines, until at least 50 characters are forwarded
+        self.assertEqual(
+            messages[:-1], [f"SoM for player 1:\n{''.join(self.lines[n : n + 3])}" for n in range(0, 9, 3)]
+        )
+        self.assertEqual(messages[-1], "SoM for player 1: log limit of 50 characters reached")
@@ -0,0 +1,30 @@
+from .bases import SoMTestBase
+
+
+class TestForcedItems(SoMTestBase):
+    """Checks that a unique local item with only one legal location is placed there in generate_basic."""
+
+    options = {"local_items": ["axe"]}
+    forced_location_name: str
+
+    def setUp(self) -> None:
+        from ..gen import location_names_by_id
+        from .fake_pysomr import FakeOW
+
+        forced_location_id, self.forced_location_name = next(
+            (location_id, name)
+            for location_id, name in enumerate(location_names_by_id)
+            if name is not None and not name.endswith(" starter weapon")
+        )
+        self.addCleanup(setattr, FakeOW, "forced_item", FakeOW.forced_item)
+        FakeOW.forced_item = ("axe", forced_location_id)
+        super().setUp()
+
+    def test_forced_item_is_placed(self) -> None:
+        location = self.multiworld.get_location(self.forced_location_name, self.player)
+        assert location.item is not None
+        self.assertEqual((location.item.name, location.item.player), ("axe", self.player))
+        self.assertTrue(location.locked)
+        # items compare by name and player, so check by identity and by count
+        self.assertNotIn(id(location.item), map(id, self.multiworld.itempool))
+        self.assertNotIn("axe", [item.name for item in self.multiworld.itempool if item.player == self.player])
@@ -0,0 +1,33 @@
+import random
+from unittest import TestCase
+
+
+class TestFakeOW(TestCase):
+    def test_sampled_options_give_usable_logic_data(self) -> None:
+        from tempfile import TemporaryDirectory
+
+        from Options import PerGameCommonOptions
+
+        from ..fuzz import sample_options
+        from ..logic import normalize_requirements
+        from ..logic_data import LogicData
+        from ..options import SoMOptions, get_somr_settings
+        from .fake_pysomr import FakeOW
+
+        rng = random.Random(0)
+        for _ in range(10):
+            sampled = sample_options(rng)
+            options = SoMOptions(
+                **{
+                    name: option_type.from_any(sampled.get(name, option_type.default))
+                    for name, option_type in SoMOptions.type_hints.items()
+                }
+            )
+            with TemporaryDirectory() as log_dir:
+                settings = {**get_somr_settings(options), "loggingDirectory": log_dir}
+                data = LogicData.from_ow(FakeOW("", "0123ABCD", settings))  # type: ignore[arg-type]
+            self.assertEqual(len(data.items), len(data.locations))
+            for _, requirements in data.locations:
+                normalize_requirements(requirements)
+            self.assertTrue(data.starting_characters)
+        self.assertTrue(set(sampled).isdisjoint(PerGameCommonOptions.type_hints))
@@ -0,0 +1,124 @@
+import typing as t
+from unittest import TestCase
+
+if t.TYPE_CHECKING:
+    from BaseClasses import MultiWorld
+
+
+class TestStageGenerateEarly(TestCase):
+    """Builds logic data for multiple slots with the offline stand-in for pysomr."""
+
+    players = 3
+    modes = ("serial", "threads", "processes")
+
+    def setUp(self) -> None:
+        from .fake_pysomr import use_fake_pysomr
+
+        use_fake_pysomr(self)
+
+    def set_settings(self, **values: t.Any) -> None:
+        from .. import SoMWorld
+
+        for name, value in values.items():
+            self.addCleanup(setattr, SoMWorld.settings, name, getattr(SoMWorld.settings, name))
+            setattr(SoMWorld.settings, name, value)
+
+    def generate_early(self, mode: str, retries: int = 0, fail: dict[int, str] | None = None) -> "MultiWorld":
+        """Generates with the FakeOW setting fail[player] set to the player's SoMR seed."""
+        from .. import SoMWorld
+        from .bases import create_multiworld
+
+        self.set_settings(
+            ow_build_mode=mode, ow_build_workers=self.players, ow_build_retries=retries, logic_cache=False
+        )
+        multiworld = create_multiworld(0, [{} for _ in range(self.players)])
+        for world in multiworld.worlds.values():
+            world.generate_early()
+        for player, setting in (fail or {}).items():
+            world = multiworld.worlds[player]
+            assert isinstance(world, SoMWorld)
+            world.somr_settings[setting] = world.somr_seed
+        SoMWorld.stage_generate_early(multiworld)
+        return multiworld
+
+    def assert_logic_data_matches_seed(self, multiworld: "MultiWorld") -> None:
+        from tempfile import TemporaryDirectory
+
+        from .. import SoMWorld
+        from ..logic_data import LogicData
+        from .fake_pysomr import FakeOW
+
+        results = []
+        for player in range(1, self.players + 1):
+            world = multiworld.worlds[player]
+            assert isinstance(world, SoMWorld)
+            self.assertFalse(world.logic_data_pending)
+            with TemporaryDirectory() as log_dir:
+                settings = {**world.somr_settings, "loggingDirectory": log_dir}
+                expected = LogicData.from_ow(FakeOW("", world.somr_seed, settings))  # type: ignore[arg-type]
+            self.assertEqual(world.logic_data, expected)
+            results.append(world.logic_data)
+        # slots differ, so a result applied to the wrong slot would be detected
+        self.assertEqual(len(set(map(repr, results))), self.players)
+
+    def test_results_are_applied_in_player_order(self) -> None:
+        for mode in self.modes:
+            with self.subTest(mode=mode):
+                self.assert_logic_data_matches_seed(self.generate_early(mode))
+
+    def assert_failures(self, errors: ExceptionGroup, expected: dict[str, type[Exception]]) -> None:
+        """Checks that errors names every player in expected and contains their errors in player order."""
+        for name in expected:
+            self.assertIn(name, str(errors))
+        self.assertEqual([type(error) for error in errors.exceptions], list(expected.values()))
+
+    def test_failing_slot(self) -> None:
+        from .fake_pysomr import FakeOW
+
+        for mode in self.modes:
+            with self.subTest(mode=mode), self.assertRaises(ExceptionGroup) as raised:
+                self.generate_early(mode, fail={2: FakeOW.fail_seed_setting})
+            self.assert_failures(raised.exception, {"Tester2": MemoryError})
+            self.assertRegex(str(raised.exception.exceptions[0]), "out of memory for seed")
+
+    def test_all_failing_slots_are_reported(self) -> None:
+        from .fake_pysomr import FakeOW
+
+        for mode in self.modes:
+            with self.subTest(mode=mode):
+                fail = {1: FakeOW.fail_seed_setting, 3: FakeOW.reject_setting}
+                with self.assertRaises(ExceptionGroup) as raised:
+                    self.generate_early(mode, fail=fail)
+                self.assert_failures(raised.exception, {"Tester1": MemoryError, "Tester3": ValueError})
+                self.assertNotIn("Tester2", str(raised.exception))
+
+    def test_failing_slot_is_retried_with_new_seed(self) -> None:
+        from .. import SoMWorld
+        from .fake_pysomr import FakeOW
+
+        for mode in self.modes:
+            with self.subTest(mode=mode):
+                multiworld = self.generate_early(mode, retries=1, fail={2: FakeOW.fail_seed_setting})
+                world = multiworld.worlds[2]
+                assert isinstance(world, SoMWorld)
+                self.assertNotEqual(world.somr_seed, world.somr_settings[FakeOW.fail_seed_setting])
+                self.assert_logic_data_matches_seed(multiworld)
+
+    def test_rejected_settings_are_not_retried(self) -> None:
+        from .fake_pysomr import FakeOW
+
+        for mode in self.modes:
+            with self.subTest(mode=mode), self.assertRaises(ExceptionGroup) as raised:
+                self.generate_early(mode, retries=1, fail={2: FakeOW.reject_setting})
+            self.assert_failures(raised.exception, {"Tester2": ValueError})
+            self.assertRegex(str(raised.exception.exceptions[0]), "invalid settings")
+
+    def test_crashed_worker_is_retried_in_new_pool(self) -> None:
+        from .. import SoMWorld
+        from .fake_pysomr import FakeOW
+
+        multiworld = self.generate_early("processes", retries=1, fail={2: FakeOW.crash_seed_setting})
+        world = multiworld.worlds[2]
+        assert isinstance(world, SoMWorld)
+        self.assertNotEqual(world.somr_seed, world.somr_settings[FakeOW.crash_seed_setting])
+        self.assert_logic_data_matches_seed(multiworld)
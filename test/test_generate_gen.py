@@ -1,16 +1,25 @@
+import typing as t
 from io import StringIO
 from pathlib import Path
 from unittest import TestCase
 
 
 class TestGenerateGen(TestCase):
-    def test_up_to_date(self) -> None:
-        from ..generate_gen import generate_gen  # TODO: skip if this doesn't exist
-
+    def assert_up_to_date(self, file_name: str, generator: t.Callable[[t.TextIO], None]) -> None:
         new_f = StringIO()
-        generate_gen(new_f)
+        generator(new_f)
         new_data = new_f.getvalue().encode("utf-8")
 
-        current_file_path = Path(__file__).parent.parent / "gen.py"
+        current_file_path = Path(__file__).parent.parent / file_name
         with open(current_file_path, "rb") as old_f:
             self.assertEqual(new_data, old_f.read())
+
+    def test_up_to_date(self) -> None:
+        from ..generate_gen import generate_gen  # TODO: skip if this doesn't exist
+
+        self.assert_up_to_date("gen.py", generate_gen)
+
+    def test_enums_up_to_date(self) -> None:
+        from ..generate_gen import generate_gen_enums  # TODO: skip if this doesn't exist
+
+        self.assert_up_to_date("gen_enums.py", generate_gen_enums)
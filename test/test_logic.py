@@ -0,0 +1,146 @@
+from unittest import TestCase
+
+
+class TestNormalizeRequirements(TestCase):
+    def test_adds_missing_casters(self) -> None:
+        from ..logic import normalize_requirements
+
+        self.assertEqual(normalize_requirements(["gnome spells"]), ("gnome spells", "spriteCaster"))
+        self.assertEqual(normalize_requirements(["lumina spells"]), ("girlCaster", "lumina spells"))
+        self.assertEqual(normalize_requirements(["sylphid spells"]), ("anyCaster", "sylphid spells"))
+
+    def test_any_caster_only_if_no_specific_caster(self) -> None:
+        from ..logic import normalize_requirements
+
+        self.assertEqual(
+            normalize_requirements(["sylphid spells", "undine spells"]),
+            ("spriteCaster", "sylphid spells", "undine spells"),
+        )
+
+    def test_drops_irrelevant(self) -> None:
+        from ..logic import normalize_requirements
+
+        self.assertEqual(normalize_requirements(["no spells"]), ())
+        self.assertEqual(normalize_requirements(["no spells", "axe"]), ("axe",))
+
+    def test_drops_implied(self) -> None:
+        from ..logic import normalize_requirements
+
+        self.assertEqual(normalize_requirements(["axe", "cuttingWeapon"]), ("axe",))
+        self.assertEqual(normalize_requirements(["whip", "sword", "elinee"]), ("sword", "whip"))
+        self.assertEqual(normalize_requirements(["whip", "elinee"]), ("elinee", "whip"))
+        # the "any spells" event requires all existing casters, so girlCaster does not imply anyCaster
+        self.assertEqual(normalize_requirements(["anyCaster", "girlCaster"]), ("anyCaster", "girlCaster"))
+
+    def test_rejects_unknown(self) -> None:
+        from ..logic import normalize_requirements
+
+        with self.assertRaises(AssertionError):
+            normalize_requirements(["not a requirement"])
+
+
+class TestLogicTable(TestCase):
+    def test_get_reachable(self) -> None:
+        import typing as t
+        from collections import Counter
+        from types import SimpleNamespace
+
+        from BaseClasses import CollectionState, Location
+
+        from ..logic import LogicTable, update_fingerprint
+
+        table = LogicTable(1)
+        free, cutting, drum = (t.cast(Location, object()) for _ in range(3))
+        table.add(free, ())
+        table.add(cutting, ("cuttingWeapon",))
+        table.add(drum, ("cuttingWeapon", "flammie drum"))
+        state = t.cast(CollectionState, SimpleNamespace(prog_items={1: Counter({"sword": 1})}))
+        update_fingerprint(state, 1, "sword")
+        self.assertEqual(table.get_reachable(state), (free, cutting))
+
+    def test_shared_rules(self) -> None:
+        from ..logic import LogicTable
+
+        table = LogicTable(1)
+        rule = table.get_rule(("axe", "gnome spells"))
+        self.assertIs(table.get_rule(("gnome spells", "axe")), rule)
+        self.assertIs(table.get_any_rule([("axe", "gnome spells"), ("axe", "gnome spells", "whip")]), rule)
+        self.assertIsNone(table.get_rule(()))
+
+    def test_get_candidate_locations(self) -> None:
+        import typing as t
+
+        from BaseClasses import Location
+
+        from ..logic import LogicTable
+
+        table = LogicTable(1)
+        free, axe, axe_or_drum = (t.cast(Location, object()) for _ in range(3))
+        table.add(free, ())
+        table.add(axe, ("axe",))
+        table.add_any(axe_or_drum, [("axe",), ("flammie drum",)])
+        self.assertEqual(table.get_candidate_locations("axe"), [free, axe_or_drum])
+        self.assertEqual(table.get_candidate_locations("GP 10"), [free, axe, axe_or_drum])
+
+
+class TestExportRequirements(TestCase):
+    def test_interned_tables(self) -> None:
+        from ..logic import export_requirements
+
+        exported = export_requirements([(100, ("axe", "gnome spells")), (101, ()), (102, ("gnome spells", "axe"))])
+        self.assertEqual(exported["names"], ["axe", "gnome spells"])
+        self.assertEqual(exported["sets"], [[0, 1], []])
+        self.assertEqual(exported["locations"], [[100, 0], [101, 1], [102, 0]])
+        self.assertEqual(exported["derived"], [])
+
+        exported = export_requirements([(100, ("elinee",))])
+        self.assertEqual(exported["names"], ["elinee", "axe", "whip", "sword"])
+        self.assertEqual(exported["derived"], [[0, [[1], [2, 3]]]])
+
+
+class TestDerivedState(TestCase):
+    def test_fingerprint_follows_collect_and_remove(self) -> None:
+        import typing as t
+        from collections import Counter
+        from types import SimpleNamespace
+
+        from BaseClasses import CollectionState
+
+        from ..logic import get_fingerprint, make_rule, update_fingerprint
+
+        prog_items: Counter[str] = Counter()
+        state = t.cast(CollectionState, SimpleNamespace(prog_items={1: prog_items}))
+        elinee = make_rule(("elinee",), 1)
+        assert elinee
+        prog_items["GP 10"] += 1
+        update_fingerprint(state, 1, "GP 10")  # not a progression item
+        self.assertEqual(get_fingerprint(state, 1), 0)
+        prog_items["whip"] += 1
+        update_fingerprint(state, 1, "whip")
+        self.assertFalse(elinee(state))
+        prog_items["sword"] += 1
+        update_fingerprint(state, 1, "sword")
+        self.assertTrue(elinee(state))
+        del prog_items["whip"]
+        update_fingerprint(state, 1, "whip")
+        self.assertFalse(elinee(state))
+        cutting = make_rule(("cuttingWeapon",), 1)
+        assert cutting
+        self.assertTrue(cutting(state))
+
+    def test_seed_count(self) -> None:
+        import typing as t
+        from collections import Counter
+        from types import SimpleNamespace
+
+        from BaseClasses import CollectionState
+
+        from ..logic import get_seed_count, seed_names, update_fingerprint
+
+        prog_items: Counter[str] = Counter()
+        state = t.cast(CollectionState, SimpleNamespace(prog_items={1: prog_items}))
+        self.assertEqual(len(seed_names), 8)
+        for seed in seed_names[:3]:
+            prog_items[seed] += 1
+            update_fingerprint(state, 1, seed)
+        self.assertEqual(get_seed_count(state, 1), 3)
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+
+class TestLogicData(TestCase):
+    def test_json_round_trip(self) -> None:
+        from ..logic_data import LogicData
+
+        data = LogicData(
+            ["boy"],
+            ["girl"],
+            {"boy": "OGboy", "girl": "OGgirl", "sprite": "OGsprite"},
+            {"boy": 38, "girl": 42},
+            [(4, ("axe", "cuttingWeapon")), (5, ())],
+            [0, 21, 38],
+            8,
+            {"matango": 0x81},
+        )
+        self.assertEqual(LogicData.from_json(data.to_json()), data)
+
+    def test_cache_key_ignores_output_settings(self) -> None:
+        from ..logic_data import get_cache_key
+
+        settings = {"opGoal": "vlong", "apSeed": "00", "loggingDirectory": "/tmp/a"}
+        other_output = {"opGoal": "vlong", "apSeed": "11", "loggingDirectory": "/tmp/b"}
+        other_logic = {"opGoal": "mtr", "apSeed": "00", "loggingDirectory": "/tmp/a"}
+        key = get_cache_key("1.0", "1234", settings)
+        self.assertEqual(key, get_cache_key("1.0", "1234", other_output))
+        self.assertNotEqual(key, get_cache_key("1.0", "1234", other_logic))
+        self.assertNotEqual(key, get_cache_key("1.0", "4321", settings))
+        self.assertNotEqual(key, get_cache_key("1.1", "1234", settings))
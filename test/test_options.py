@@ -0,0 +1,20 @@
+import typing as t
+from unittest import TestCase
+
+if t.TYPE_CHECKING:
+    from Options import Option
+
+
+class TestOptions(TestCase):
+    def test_somr_option_table(self) -> None:
+        from ..options import SoMOptions, SoMROptionProto, get_somr_option_table
+
+        table = get_somr_option_table(SoMOptions)
+        self.assertIs(table, get_somr_option_table(SoMOptions))
+        type_hints = t.get_type_hints(SoMOptions)
+        self.assertTrue(table)
+        for name, setting, encode in table:
+            option = type_hints[name].from_any(type_hints[name].default)
+            assert isinstance(option, SoMROptionProto)
+            self.assertEqual(setting, option.somr_setting)
+            self.assertEqual(encode(t.cast("Option[int]", option).value), option.somr_value)
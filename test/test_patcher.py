@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+
+class TestPatcher(TestCase):
+    def test_find_patches_and_up_to_date(self) -> None:
+        import zipfile
+        from pathlib import Path
+        from tempfile import TemporaryDirectory
+
+        from ..patcher import find_patches, get_patch_hash, hash_suffix, is_up_to_date
+
+        with TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            zip_path = tmp_path / "AP_1234.zip"
+            with zipfile.ZipFile(zip_path, "w") as zf:
+                zf.writestr("AP_1234_P2_Two.apsom", b"two")
+                zf.writestr("AP_1234_P1_One.apsom", b"one")
+                zf.writestr("AP_1234.archipelago", b"")
+            patches = find_patches(zip_path, tmp_path / "extract")
+            self.assertEqual([patch.name for patch in patches], ["AP_1234_P1_One.apsom", "AP_1234_P2_Two.apsom"])
+            self.assertEqual(find_patches(tmp_path / "extract", tmp_path), patches)
+
+            out_file = tmp_path / "AP_1234_P1_One.smc"
+            patch_hash = get_patch_hash(patches[0])
+            self.assertFalse(is_up_to_date(out_file, patch_hash))
+            out_file.write_bytes(b"rom")
+            Path(str(out_file) + hash_suffix).write_text(patch_hash)
+            self.assertTrue(is_up_to_date(out_file, patch_hash))
+            self.assertFalse(is_up_to_date(out_file, get_patch_hash(patches[1])))
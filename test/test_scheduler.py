@@ -0,0 +1,35 @@
+import threading
+from unittest import TestCase
+
+
+class TestMemoryBudget(TestCase):
+    def test_queues_work_that_does_not_fit(self) -> None:
+        from ..scheduler import MemoryBudget
+
+        budget = MemoryBudget(100)
+        budget.acquire(60)
+        acquired = threading.Event()
+
+        def worker() -> None:
+            with budget.reserve(60):
+                acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+        budget.release(60)
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+        self.assertEqual(budget.used, 0)
+
+    def test_oversized_and_unlimited(self) -> None:
+        from ..scheduler import MemoryBudget
+
+        budget = MemoryBudget(100)
+        with budget.reserve(1000):
+            self.assertEqual(budget.used, 100)
+        self.assertEqual(budget.used, 0)
+
+        unlimited = MemoryBudget(0)
+        with unlimited.reserve(1000), unlimited.reserve(1000):
+            self.assertEqual(unlimited.used, 0)
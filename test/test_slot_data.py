@@ -0,0 +1,57 @@
+import typing as t
+from unittest import TestCase
+
+
+class TestFillSlotData(TestCase):
+    """Checks that slot data describes the rules of create_regions, with the offline stand-in for pysomr."""
+
+    def setUp(self) -> None:
+        from .. import SoMWorld
+        from .fake_pysomr import use_fake_pysomr
+
+        use_fake_pysomr(self)
+        for name, value in {"ow_build_mode": "serial", "logic_cache": False}.items():
+            self.addCleanup(setattr, SoMWorld.settings, name, getattr(SoMWorld.settings, name))
+            setattr(SoMWorld.settings, name, value)
+
+    def fill_slot_data(self, options: dict[str, t.Any]) -> tuple[t.Any, dict[str, t.Any]]:
+        import json
+
+        from .. import SoMWorld
+        from .bases import create_multiworld
+
+        multiworld = create_multiworld(0, [options])
+        world = multiworld.worlds[1]
+        assert isinstance(world, SoMWorld)
+        world.generate_early()
+        SoMWorld.stage_generate_early(multiworld)
+        world.create_regions()
+        slot_data = world.fill_slot_data()
+        json.dumps(slot_data)  # slot data has to be JSON serializable
+        return world, slot_data
+
+    def test_casters(self) -> None:
+        from ..gen import spell_progression
+
+        world, slot_data = self.fill_slot_data({})
+        self.assertEqual(len(slot_data["class_casters"]), len(slot_data["classes"]))
+        for char, (_, _, class_index, _) in zip(slot_data["characters"], slot_data["character_data"]):
+            caster = slot_data["class_casters"][class_index]
+            self.assertEqual(caster, spell_progression[world.char_classes[char]])
+        # anyCaster requires all casters, not any of them
+        self.assertEqual(slot_data["any_caster"], ["girlCaster", "spriteCaster"])
+
+    def test_no_caster(self) -> None:
+        _, slot_data = self.fill_slot_data({"girl_role": "boy", "sprite_role": "boy"})
+        self.assertEqual(slot_data["class_casters"], ["noCaster"])
+        self.assertEqual(slot_data["any_caster"], [])
+
+    def test_goal(self) -> None:
+        from ..gen import LocationId
+
+        _, slot_data = self.fill_slot_data({"goal": "mana_tree_revival", "flammie_drum": "find"})
+        self.assertEqual(slot_data["goal"], {"goal": "mana_tree_revival", "flammie_drum": True, "location": None})
+        _, slot_data = self.fill_slot_data({"goal": "vanilla_long", "flammie_drum": "find"})
+        self.assertEqual(
+            slot_data["goal"], {"goal": "vanilla_long", "flammie_drum": False, "location": LocationId.dread_slime}
+        )
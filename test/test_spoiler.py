@@ -0,0 +1,25 @@
+from io import StringIO
+from unittest import TestCase
+
+
+class TestCopySpoiler(TestCase):
+    spoiler = "SoMR spoiler\nseed: 1234\n\nItems:\n  potos chest: axe\n\nBosses:\n  mantis ant: hydra\n"
+
+    def test_copy_all(self) -> None:
+        from .. import spoiler
+
+        dest = StringIO()
+        chunk_size = spoiler.chunk_size
+        spoiler.chunk_size = 7  # make sure we go through multiple chunks
+        try:
+            spoiler.copy_spoiler(StringIO(self.spoiler), dest)
+        finally:
+            spoiler.chunk_size = chunk_size
+        self.assertEqual(dest.getvalue(), self.spoiler)
+
+    def test_copy_sections(self) -> None:
+        from ..spoiler import copy_spoiler
+
+        dest = StringIO()
+        copy_spoiler(StringIO(self.spoiler), dest, ["bosses", " items"])
+        self.assertEqual(dest.getvalue(), "Items:\n  potos chest: axe\n\nBosses:\n  mantis ant: hydra\n")
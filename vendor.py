@@ -15,7 +15,7 @@ include_py = {
     "cp311": ["cp311"],
     "cp312": ["cp312"],
     "cp313": ["cp313"],
-    "cp314": ["cp314"],  # ["cp314", "cp314t"] in the future
+    "cp314": ["cp314"],  # add "cp314t" once pysomr ships free-threaded wheels
 }
 include_plat = {
     "darwin": ["macosx"],
@@ -156,6 +156,9 @@ def _install(root: str) -> None:
     py_ver = py_impl_short + sysconfig.get_config_var("py_version_nodot")
     nodot_plat = sysconfig.get_config_var("py_version_nodot_plat").split("-", 1)[0]
     py_abi_number = nodot_plat if nodot_plat else sysconfig.get_config_var("SOABI").split("-", 2)[1]
+    # free-threaded ABIs have a "t" suffix, e.g. cp314t, which include_py does not list, so they are rejected below
+    if sysconfig.get_config_var("Py_GIL_DISABLED") and not py_abi_number.endswith("t"):
+        py_abi_number += "t"
     py_abi = py_impl_short + py_abi_number
     py_arch = sysconfig.get_platform().split("-")[-1]  # macOS always gives "universal2", which is hopefully fine
     multiarch = sysconfig.get_config_var("MULTIARCH")  # darwin for macOS
@@ -164,6 +167,8 @@ def _install(root: str) -> None:
 
     if py_os not in include_plat or py_os not in include_arch or py_arch not in include_arch[py_os]:
         raise ValueError(f"Unsupported platform {py_os}-{py_arch} for installation of {requirements_name} packages")
+    if py_abi not in include_py.get(py_ver, ()):
+        raise ValueError(f"Unsupported python {py_ver}-{py_abi} for installation of {requirements_name} packages")
 
     # detect if out assumption of extension naming is correct so we can filter what to extract
     ext_suffix = sysconfig.get_config_var("EXT_SUFFIX")